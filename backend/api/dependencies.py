@@ -4,16 +4,19 @@ API Dependencies - Dependency injection for FastAPI
 Provides instances of services and adapters.
 """
 
+from fastapi import Request
+
 from application.backtest_service import BacktestService
 from infrastructure.yfinance_adapter import YFinanceAdapter
 
 
-def get_yfinance_adapter() -> YFinanceAdapter:
-    """Get YFinance adapter instance"""
-    return YFinanceAdapter()
+def get_yfinance_adapter(request: Request) -> YFinanceAdapter:
+    """Get the app's shared YFinance adapter (created at startup, keeps its caches)"""
+    adapter: YFinanceAdapter = request.app.state.yfinance_adapter
+    return adapter
 
 
-def get_backtest_service() -> BacktestService:
-    """Get backtest service instance with injected adapter"""
-    adapter = get_yfinance_adapter()
-    return BacktestService(data_adapter=adapter)
+def get_backtest_service(request: Request) -> BacktestService:
+    """Get the app's shared backtest service (created at startup)"""
+    service: BacktestService = request.app.state.backtest_service
+    return service
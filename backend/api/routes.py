@@ -4,76 +4,143 @@ API Routes - HTTP endpoints
 FastAPI route handlers for the backtest API.
 """
 
+from collections.abc import Iterator, Sequence
 from datetime import datetime
+from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+import msgspec
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 
 from api.dependencies import get_backtest_service
-from api.schemas import (
-    BacktestRequest,
-    BacktestResponse,
-    BacktestResultSchema,
-    ComparisonSchema,
-    ErrorResponse,
-    PerformerInfoSchema,
-    PortfolioSnapshotSchema,
-)
+from api.schemas import BacktestRequest, BacktestResponse, ErrorResponse
 from application.backtest_service import BacktestService
-from domain.models import BacktestResult, Comparison
+from domain.models import BacktestResult, Comparison, PortfolioHistory, PortfolioSnapshot
 from infrastructure.yfinance_adapter import StockDataError
 
 router = APIRouter(prefix="/api", tags=["backtest"])
 
+MSGPACK_MEDIA_TYPE = "application/msgpack"
 
-def convert_result_to_schema(result: BacktestResult) -> BacktestResultSchema:
-    """Convert domain BacktestResult to API schema"""
-    return BacktestResultSchema(
-        symbol=result.symbol,
-        name=result.name,
-        strategy=result.strategy,
-        total_return=result.total_return,
-        cagr=result.cagr,
-        max_drawdown=result.max_drawdown,
-        volatility=result.volatility,
-        sharpe_ratio=result.sharpe_ratio,
-        final_value=result.final_value,
-        total_invested=result.total_invested,
-        history=[
-            PortfolioSnapshotSchema(
-                date=snapshot.date,
-                value=snapshot.value,
-                shares=snapshot.shares,
-                cumulative_invested=snapshot.cumulative_invested,
-            )
-            for snapshot in result.history
-        ],
-    )
+
+class MsgPackResponse(Response):
+    """MessagePack response (same layout as the JSON one, dates as ISO strings)"""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.msgpack.encode(content)
 
 
-def convert_comparison_to_schema(comparison: Comparison) -> ComparisonSchema:
-    """Convert domain Comparison to API schema"""
-    return ComparisonSchema(
-        best_return=comparison.best_return,
-        best_sharpe=comparison.best_sharpe,
-        lowest_risk=comparison.lowest_risk,
-        best_cagr=comparison.best_cagr,
-        best_performer=PerformerInfoSchema(
-            symbol=comparison.best_performer.symbol,
-            total_return=comparison.best_performer.total_return,
-        ),
-        worst_performer=PerformerInfoSchema(
-            symbol=comparison.worst_performer.symbol,
-            total_return=comparison.worst_performer.total_return,
-        ),
-        average_return=comparison.average_return,
-        total_invested=comparison.total_invested,
+def _accepts_msgpack(accept: str | None) -> bool:
+    """
+    Whether an Accept header prefers MessagePack over JSON
+
+    MessagePack is chosen when it is listed with a positive q-value that is
+    not below the q-value given for application/json (JSON is the default).
+    """
+    if not accept:
+        return False
+
+    quality: dict[str, float] = {}
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        quality[media_type.lower()] = q
+
+    msgpack_q = quality.get(MSGPACK_MEDIA_TYPE, 0.0)
+    return msgpack_q > 0 and msgpack_q >= quality.get("application/json", 0.0)
+
+
+def _history_rows(
+    history: Sequence[PortfolioSnapshot],
+) -> Iterator[tuple[datetime, float, float, float]]:
+    """Iterate history as plain tuples, reading columns directly when available"""
+    if isinstance(history, PortfolioHistory):
+        return history.rows()
+    return (
+        (snapshot.date, snapshot.value, snapshot.shares, snapshot.cumulative_invested)
+        for snapshot in history
     )
 
 
+def convert_result_to_schema(
+    result: BacktestResult, include_history: bool = True
+) -> dict[str, Any]:
+    """
+    Convert domain BacktestResult to a response dict (BacktestResultSchema layout)
+
+    Args:
+        result: Domain backtest result
+        include_history: Whether to serialize the daily history (default: True)
+
+    Returns:
+        Response dict, without the "history" key if include_history is False
+    """
+    data: dict[str, Any] = {
+        "symbol": result.symbol,
+        "name": result.name,
+        "strategy": result.strategy,
+        "total_return": result.total_return,
+        "cagr": result.cagr,
+        "max_drawdown": result.max_drawdown,
+        "volatility": result.volatility,
+        "sharpe_ratio": result.sharpe_ratio,
+        "final_value": result.final_value,
+        "total_invested": result.total_invested,
+    }
+    if include_history:
+        data["history"] = [
+            {
+                "date": date,
+                "value": value,
+                "shares": shares,
+                "cumulative_invested": cumulative_invested,
+            }
+            for date, value, shares, cumulative_invested in _history_rows(result.history)
+        ]
+    return data
+
+
+def convert_comparison_to_schema(comparison: Comparison) -> dict[str, Any]:
+    """Convert domain Comparison to a response dict (ComparisonSchema layout)"""
+    return {
+        "best_return": comparison.best_return,
+        "best_sharpe": comparison.best_sharpe,
+        "lowest_risk": comparison.lowest_risk,
+        "best_cagr": comparison.best_cagr,
+        "best_performer": {
+            "symbol": comparison.best_performer.symbol,
+            "total_return": comparison.best_performer.total_return,
+        },
+        "worst_performer": {
+            "symbol": comparison.worst_performer.symbol,
+            "total_return": comparison.worst_performer.total_return,
+        },
+        "average_return": comparison.average_return,
+        "total_invested": comparison.total_invested,
+    }
+
+
 @router.post(
     "/backtest",
-    response_model=BacktestResponse,
+    # Results are trusted domain output: serialize them with orjson directly
+    # instead of re-validating every snapshot through BacktestResponse
+    response_class=ORJSONResponse,
+    response_model=None,
     responses={
+        200: {
+            "model": BacktestResponse,
+            "description": "Backtest results and comparison",
+            "content": {MSGPACK_MEDIA_TYPE: {}},
+        },
         400: {"model": ErrorResponse, "description": "Invalid request"},
         404: {"model": ErrorResponse, "description": "Stock data not found"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
@@ -82,7 +149,8 @@ def convert_comparison_to_schema(comparison: Comparison) -> ComparisonSchema:
 async def backtest(
     request: BacktestRequest,
     service: BacktestService = Depends(get_backtest_service),
-) -> BacktestResponse:
+    accept: str | None = Header(None),
+) -> Response:
     """
     Run backtest for one or more stocks
 
@@ -92,9 +160,10 @@ async def backtest(
     Args:
         request: Backtest parameters including stocks, dates, and strategy
         service: Injected backtest service
+        accept: Accept header; "application/msgpack" selects a MessagePack body
 
     Returns:
-        Backtest results and comparison
+        Backtest results and comparison (JSON unless MessagePack is accepted)
 
     Raises:
         HTTPException 400: Invalid parameters
@@ -102,26 +171,23 @@ async def backtest(
         HTTPException 500: Internal error
     """
     try:
-        # Convert date to datetime
-        start_datetime = datetime.combine(request.start_date, datetime.min.time())
-        end_datetime = datetime.combine(request.end_date, datetime.max.time())
-
         # Run backtest
-        results, comparison = service.run_multiple_backtests(
+        results, comparison = await service.run_multiple_backtests_async(
             symbols=request.stocks,
-            start_date=start_datetime,
-            end_date=end_datetime,
+            start_date=request.start_date,
+            end_date=request.end_date,
             strategy=request.strategy,
             amount=request.investment.amount,
         )
 
-        # Convert to response schema
-        response = BacktestResponse(
-            results=[convert_result_to_schema(r) for r in results],
-            comparison=convert_comparison_to_schema(comparison),
-        )
-
-        return response
+        # Convert to response (BacktestResponse layout)
+        content = {
+            "results": [convert_result_to_schema(r, request.include_history) for r in results],
+            "comparison": convert_comparison_to_schema(comparison),
+        }
+        if _accepts_msgpack(accept):
+            return MsgPackResponse(content=content)
+        return ORJSONResponse(content=content)
 
     except StockDataError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
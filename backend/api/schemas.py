@@ -5,9 +5,9 @@ These models define the HTTP API interface.
 """
 
 from datetime import date, datetime
-from typing import Any, Literal
+from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
 
 # Request schemas
 
@@ -31,22 +31,18 @@ class BacktestRequest(BaseModel):
     end_date: date = Field(..., description="Backtest end date")
     strategy: Literal["lump_sum", "dca"] = Field(..., description="Investment strategy")
     investment: InvestmentParams = Field(..., description="Investment parameters")
+    include_history: bool = Field(
+        True, description="Include daily portfolio history in each result"
+    )
 
-    @field_validator("end_date")
-    @classmethod
-    def end_date_must_be_after_start_date(cls, v: date, info: Any) -> date:
-        """Validate end_date is after start_date"""
-        if "start_date" in info.data and v <= info.data["start_date"]:
+    @model_validator(mode="after")
+    def check_dates_and_symbols(self) -> "BacktestRequest":
+        """Validate end_date is after start_date and stock symbols are not empty"""
+        if self.end_date <= self.start_date:
             raise ValueError("end_date must be after start_date")
-        return v
-
-    @field_validator("stocks")
-    @classmethod
-    def stocks_must_not_be_empty(cls, v: list[str]) -> list[str]:
-        """Validate stock symbols are not empty"""
-        if any(not symbol.strip() for symbol in v):
+        if any(not symbol.strip() for symbol in self.stocks):
             raise ValueError("Stock symbols cannot be empty")
-        return v
+        return self
 
 
 # Response schemas
@@ -85,7 +81,9 @@ class BacktestResultSchema(BaseModel):
     total_invested: float
 
     # Historical data
-    history: list[PortfolioSnapshotSchema]
+    history: list[PortfolioSnapshotSchema] | None = Field(
+        None, description="Daily portfolio history (omitted if include_history is false)"
+    )
 
     class Config:
         from_attributes = True
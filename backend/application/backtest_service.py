@@ -7,14 +7,20 @@ Orchestrates domain logic and infrastructure:
 - Handles errors and coordinates multiple operations
 """
 
-from datetime import datetime
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from typing import Literal
 
 from domain import backtest as backtest_logic
 from domain.calculations import calculate_comparison
-from domain.models import BacktestResult, Comparison
+from domain.models import BacktestResult, Comparison, PriceSeries, StockPrice
 from infrastructure.yfinance_adapter import StockDataError, YFinanceAdapter
 
+# Shared pool for blocking data fetches (network and cache file I/O)
+_IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="backtest-io")
+
 
 class BacktestService:
     """
@@ -36,8 +42,8 @@ class BacktestService:
     def run_backtest(
         self,
         symbol: str,
-        start_date: datetime,
-        end_date: datetime,
+        start_date: date,
+        end_date: date,
         strategy: Literal["lump_sum", "dca"],
         amount: float,
     ) -> BacktestResult:
@@ -61,6 +67,22 @@ class BacktestService:
         # Fetch data (side effect - infrastructure layer)
         prices, stock_name = self.data_adapter.get_stock_data(symbol, start_date, end_date)
 
+        return self._run_strategy(prices, stock_name, symbol, strategy, amount)
+
+    def _run_strategy(
+        self,
+        prices: Sequence[StockPrice],
+        stock_name: str,
+        symbol: str,
+        strategy: Literal["lump_sum", "dca"],
+        amount: float,
+    ) -> BacktestResult:
+        """
+        Run the selected strategy on already fetched prices
+
+        Raises:
+            ValueError: If strategy or amount is invalid
+        """
         # Run backtest (pure function - domain layer)
         if strategy == "lump_sum":
             result = backtest_logic.backtest_lump_sum(
@@ -84,14 +106,17 @@ class BacktestService:
     def run_multiple_backtests(
         self,
         symbols: list[str],
-        start_date: datetime,
-        end_date: datetime,
+        start_date: date,
+        end_date: date,
         strategy: Literal["lump_sum", "dca"],
         amount: float,
     ) -> tuple[list[BacktestResult], Comparison]:
         """
         Run backtests for multiple stocks and compare results
 
+        Blocking wrapper around run_multiple_backtests_async for callers
+        outside an event loop.
+
         Args:
             symbols: List of stock ticker symbols
             start_date: Backtest start date
@@ -104,34 +129,118 @@ class BacktestService:
             - results: List of BacktestResult (one per successful symbol)
             - comparison: Comparison of all results
 
+        Raises:
+            ValueError: If no symbols provided or all symbols fail
+        """
+        return asyncio.run(
+            self.run_multiple_backtests_async(symbols, start_date, end_date, strategy, amount)
+        )
+
+    async def run_multiple_backtests_async(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        strategy: Literal["lump_sum", "dca"],
+        amount: float,
+        max_concurrency: int = 8,
+    ) -> tuple[list[BacktestResult], Comparison]:
+        """
+        Run backtests for multiple stocks concurrently and compare results
+
+        Each distinct symbol is fetched once; the blocking fetches run
+        concurrently on a shared I/O thread pool (identical in-flight fetches
+        from other requests are coalesced by the adapter). The backtest math
+        itself is vectorized and cheap, so it runs inline once the data has
+        arrived.
+
+        Args:
+            symbols: List of stock ticker symbols
+            start_date: Backtest start date
+            end_date: Backtest end date
+            strategy: Investment strategy
+            amount: Investment amount
+            max_concurrency: Maximum number of symbols fetched at the same time
+
+        Returns:
+            Tuple of (results, comparison), results in the order of symbols
+
         Raises:
             ValueError: If no symbols provided or all symbols fail
         """
         if not symbols:
             raise ValueError("At least one symbol is required")
 
-        results: list[BacktestResult] = []
-        errors: list[tuple[str, str]] = []
+        # Bound concurrent fetches to avoid hammering Yahoo Finance
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        # Run backtest for each symbol
-        for symbol in symbols:
-            try:
-                result = self.run_backtest(
-                    symbol=symbol,
-                    start_date=start_date,
-                    end_date=end_date,
-                    strategy=strategy,
-                    amount=amount,
+        async def fetch(symbol: str) -> tuple[PriceSeries, str]:
+            async with semaphore:
+                return await self.data_adapter.get_stock_data_async(
+                    symbol, start_date, end_date, executor=_IO_POOL
                 )
-                results.append(result)
-            except StockDataError as e:
+
+        # Fetch every distinct symbol once, then run the CPU-only backtests
+        # on the fetched data in request order
+        distinct = list(dict.fromkeys(symbols))
+        fetched = dict(
+            zip(
+                distinct,
+                await asyncio.gather(
+                    *(fetch(symbol) for symbol in distinct), return_exceptions=True
+                ),
+                strict=True,
+            )
+        )
+
+        outcomes: list[BacktestResult | BaseException] = []
+        for symbol in symbols:
+            data = fetched[symbol]
+            if isinstance(data, BaseException):
                 # Collect error but continue with other symbols
-                errors.append((symbol, str(e)))
+                outcomes.append(data)
                 continue
+
+            prices, stock_name = data
+            try:
+                outcomes.append(self._run_strategy(prices, stock_name, symbol, strategy, amount))
             except Exception as e:
+                outcomes.append(e)
+
+        return self._collect_results(symbols, outcomes)
+
+    def _collect_results(
+        self,
+        symbols: list[str],
+        outcomes: list[BacktestResult | BaseException],
+    ) -> tuple[list[BacktestResult], Comparison]:
+        """
+        Split per-symbol outcomes into results and errors, then compare results
+
+        Args:
+            symbols: Symbols in request order
+            outcomes: Result or raised exception for each symbol
+
+        Returns:
+            Tuple of (results, comparison)
+
+        Raises:
+            ValueError: If all symbols failed
+        """
+        results: list[BacktestResult] = []
+        errors: list[tuple[str, str]] = []
+
+        for symbol, outcome in zip(symbols, outcomes, strict=True):
+            if isinstance(outcome, StockDataError):
+                errors.append((symbol, str(outcome)))
+            elif isinstance(outcome, Exception):
                 # Unexpected errors
-                errors.append((symbol, f"Unexpected error: {e!s}"))
-                continue
+                errors.append((symbol, f"Unexpected error: {outcome!s}"))
+            elif isinstance(outcome, BaseException):
+                # Never swallow cancellation or interpreter exit
+                raise outcome
+            else:
+                results.append(outcome)
 
         # Check if we have any successful results
         if not results:
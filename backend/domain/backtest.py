@@ -7,17 +7,45 @@ All backtest functions are pure:
 - Easy to test and reason about
 """
 
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
 from domain.calculations import (
+    TRADING_DAYS_PER_YEAR,
+    FloatArray,
     calculate_cagr,
-    calculate_max_drawdown,
-    calculate_sharpe_ratio,
-    calculate_volatility,
+    calculate_risk_metrics,
 )
-from domain.models import BacktestResult, PortfolioSnapshot, StockPrice
+from domain.models import BacktestResult, PortfolioHistory, PriceSeries, StockPrice
+
+
+def _closes_array(prices: Sequence[StockPrice]) -> FloatArray:
+    """Closing prices as float64, filled straight into a preallocated array"""
+    if isinstance(prices, PriceSeries):
+        return prices.closes
+    return np.fromiter((p.close for p in prices), dtype=np.float64, count=len(prices))
+
+
+def _dates_array(prices: Sequence[StockPrice]) -> npt.NDArray[np.datetime64]:
+    """Price dates as datetime64 (wall-clock time, timezone info dropped)"""
+    if isinstance(prices, PriceSeries):
+        return prices.dates
+    return np.fromiter(
+        (p.date.replace(tzinfo=None) for p in prices), dtype="datetime64[us]", count=len(prices)
+    )
+
+
+def _years_spanned(dates: npt.NDArray[np.datetime64]) -> float:
+    """Calendar years between the first and last date (minimum 1 trading day)"""
+    days = dates[[0, -1]].astype("datetime64[D]")
+    years = float((days[1] - days[0]) / np.timedelta64(1, "D")) / 365.25
+    return years if years > 0 else 1.0 / TRADING_DAYS_PER_YEAR
 
 
 def backtest_lump_sum(
-    prices: list[StockPrice],
+    prices: Sequence[StockPrice],
     initial_amount: float,
     symbol: str = "",
     name: str = "",
@@ -28,7 +56,7 @@ def backtest_lump_sum(
     Strategy: Invest all money at once on day 1, then hold.
 
     Args:
-        prices: List of historical stock prices
+        prices: Historical stock prices (a list or a columnar PriceSeries)
         initial_amount: Amount to invest on day 1
         symbol: Stock symbol (optional)
         name: Stock name (optional)
@@ -46,48 +74,31 @@ def backtest_lump_sum(
         raise ValueError(f"Initial amount must be positive, got {initial_amount}")
 
     # Buy all shares on day 1
-    first_price = prices[0].close
-    shares = initial_amount / first_price
-
-    # Build portfolio history
-    history: list[PortfolioSnapshot] = []
-    for price in prices:
-        snapshot = PortfolioSnapshot(
-            date=price.date,
-            value=shares * price.close,
-            shares=shares,
-            cumulative_invested=initial_amount,
-        )
-        history.append(snapshot)
+    closes = _closes_array(prices)
+    dates = _dates_array(prices)
+    shares = initial_amount / float(closes[0])
+
+    # Portfolio value for every day in one vectorized step
+    values = shares * closes
+
+    # Build portfolio history (columnar, snapshots are created lazily)
+    history = PortfolioHistory(
+        dates=dates,
+        values=values,
+        shares=np.full(len(prices), shares),
+        cumulative_invested=np.full(len(prices), initial_amount),
+    )
 
     # Calculate metrics
-    final_value = history[-1].value
+    final_value = float(values[-1])
     total_return = (final_value - initial_amount) / initial_amount
 
     # Calculate CAGR
-    years = (prices[-1].date - prices[0].date).days / 365.25
-    if years <= 0:
-        years = 1.0 / 252  # Minimum 1 trading day
+    years = _years_spanned(dates)
     cagr = calculate_cagr(initial_amount, final_value, years)
 
-    # Calculate max drawdown
-    values = [snapshot.value for snapshot in history]
-    max_dd = calculate_max_drawdown(values)
-
-    # Calculate daily returns for volatility and Sharpe
-    returns: list[float] = []
-    for i in range(1, len(values)):
-        if values[i - 1] > 0:
-            daily_return = (values[i] - values[i - 1]) / values[i - 1]
-            returns.append(daily_return)
-
-    # Handle edge case: only 1 data point
-    if not returns:
-        volatility = 0.0
-        sharpe_ratio = 0.0
-    else:
-        volatility = calculate_volatility(returns)
-        sharpe_ratio = calculate_sharpe_ratio(returns)
+    # Calculate max drawdown, volatility and Sharpe in one go
+    max_dd, volatility, sharpe_ratio = calculate_risk_metrics(values)
 
     return BacktestResult(
         symbol=symbol,
@@ -105,7 +116,7 @@ def backtest_lump_sum(
 
 
 def backtest_dca(
-    prices: list[StockPrice],
+    prices: Sequence[StockPrice],
     monthly_amount: float,
     symbol: str = "",
     name: str = "",
@@ -116,7 +127,7 @@ def backtest_dca(
     Strategy: Invest a fixed amount every month on the first trading day.
 
     Args:
-        prices: List of historical stock prices
+        prices: Historical stock prices (a list or a columnar PriceSeries)
         monthly_amount: Amount to invest each month
         symbol: Stock symbol (optional)
         name: Stock name (optional)
@@ -133,62 +144,48 @@ def backtest_dca(
     if monthly_amount <= 0:
         raise ValueError(f"Monthly amount must be positive, got {monthly_amount}")
 
-    # Track investment state
-    total_shares = 0.0
-    total_invested = 0.0
-    last_month = None
-
-    # Build portfolio history
-    history: list[PortfolioSnapshot] = []
-
-    for price in prices:
-        current_month = (price.date.year, price.date.month)
-
-        # Invest on first trading day of each month
-        if current_month != last_month:
-            # Buy shares
-            shares_bought = monthly_amount / price.close
-            total_shares += shares_bought
-            total_invested += monthly_amount
-            last_month = current_month
-
-        # Record snapshot
-        snapshot = PortfolioSnapshot(
-            date=price.date,
-            value=total_shares * price.close,
-            shares=total_shares,
-            cumulative_invested=total_invested,
-        )
-        history.append(snapshot)
+    closes = _closes_array(prices)
+    dates = _dates_array(prices)
+    months = dates.astype("datetime64[M]")
+
+    n = len(prices)
+
+    # Invest on first trading day of each month
+    buy_mask = np.empty(n, dtype=np.bool_)
+    buy_mask[0] = True
+    np.not_equal(months[1:], months[:-1], out=buy_mask[1:])
+
+    # Track investment state for every day at once (purchases are
+    # accumulated in place, no intermediate arrays)
+    total_shares = np.zeros(n)
+    np.divide(monthly_amount, closes, out=total_shares, where=buy_mask)
+    np.cumsum(total_shares, out=total_shares)
+
+    cumulative_invested = np.zeros(n)
+    cumulative_invested[buy_mask] = monthly_amount
+    np.cumsum(cumulative_invested, out=cumulative_invested)
+
+    values = total_shares * closes
+
+    # Build portfolio history (columnar, snapshots are created lazily)
+    history = PortfolioHistory(
+        dates=dates,
+        values=values,
+        shares=total_shares,
+        cumulative_invested=cumulative_invested,
+    )
 
     # Calculate metrics
-    final_value = history[-1].value
+    final_value = float(values[-1])
+    total_invested = float(cumulative_invested[-1])
     total_return = (final_value - total_invested) / total_invested
 
     # Calculate CAGR
-    years = (prices[-1].date - prices[0].date).days / 365.25
-    if years <= 0:
-        years = 1.0 / 252  # Minimum 1 trading day
+    years = _years_spanned(dates)
     cagr = calculate_cagr(total_invested, final_value, years)
 
-    # Calculate max drawdown
-    values = [snapshot.value for snapshot in history]
-    max_dd = calculate_max_drawdown(values)
-
-    # Calculate daily returns for volatility and Sharpe
-    returns: list[float] = []
-    for i in range(1, len(values)):
-        if values[i - 1] > 0:
-            daily_return = (values[i] - values[i - 1]) / values[i - 1]
-            returns.append(daily_return)
-
-    # Handle edge case: only 1 data point
-    if not returns:
-        volatility = 0.0
-        sharpe_ratio = 0.0
-    else:
-        volatility = calculate_volatility(returns)
-        sharpe_ratio = calculate_sharpe_ratio(returns)
+    # Calculate max drawdown, volatility and Sharpe in one go
+    max_dd, volatility, sharpe_ratio = calculate_risk_metrics(values)
 
     return BacktestResult(
         symbol=symbol,
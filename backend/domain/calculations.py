@@ -9,8 +9,20 @@ All functions in this module are pure:
 This makes them easy to test and reason about.
 """
 
+import math
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
 from domain.models import BacktestResult, Comparison, PerformerInfo
 
+FloatArray = npt.NDArray[np.float64]
+
+# Annualization: 252 trading days per year (volatility scales with its square root)
+TRADING_DAYS_PER_YEAR = 252
+_SQRT_TRADING_DAYS = math.sqrt(TRADING_DAYS_PER_YEAR)
+
 
 def calculate_cagr(initial: float, final: float, years: float) -> float:
     """
@@ -41,12 +53,39 @@ def calculate_cagr(initial: float, final: float, years: float) -> float:
     return float((final / initial) ** (1 / years) - 1)
 
 
-def calculate_max_drawdown(values: list[float]) -> float:
+def _max_drawdown(values: FloatArray) -> float:
+    """Maximum drawdown of a non-empty float64 array"""
+    # Running peak at every point in time
+    peaks = np.maximum.accumulate(values)
+
+    # Drawdown from peak (left at 0 where peak <= 0 to avoid division by zero)
+    drawdowns = np.divide(values - peaks, peaks, out=np.zeros_like(values), where=peaks > 0)
+
+    return float(drawdowns.min())
+
+
+def _daily_returns(values: FloatArray) -> FloatArray:
+    """Daily returns of a value series, skipping days that start from a zero value"""
+    previous = values[:-1]
+    valid = previous > 0
+    returns: FloatArray = np.diff(values)[valid] / previous[valid]
+    return returns
+
+
+def _annualized_volatility(returns: FloatArray) -> float:
+    """Annualized sample standard deviation of a non-empty float64 array"""
+    if returns.size == 1:
+        return 0.0
+
+    return float(returns.std(ddof=1) * _SQRT_TRADING_DAYS)
+
+
+def calculate_max_drawdown(values: Sequence[float] | FloatArray) -> float:
     """
     Calculate maximum drawdown (peak to trough decline)
 
     Args:
-        values: List of portfolio values over time
+        values: Portfolio values over time (list or NumPy array)
 
     Returns:
         Maximum drawdown as negative decimal (e.g., -0.2 = -20%)
@@ -55,34 +94,21 @@ def calculate_max_drawdown(values: list[float]) -> float:
     Raises:
         ValueError: If values list is empty
     """
-    if not values:
+    if len(values) == 0:
         raise ValueError("Values list cannot be empty")
 
     if len(values) == 1:
         return 0.0
 
-    peak = values[0]
-    max_dd = 0.0
-
-    for value in values:
-        # Update peak if we reach a new high
-        if value > peak:
-            peak = value
+    return _max_drawdown(np.asarray(values, dtype=np.float64))
 
-        # Calculate drawdown from peak
-        if peak > 0:  # Avoid division by zero
-            drawdown = (value - peak) / peak
-            max_dd = min(max_dd, drawdown)
 
-    return max_dd
-
-
-def calculate_volatility(returns: list[float]) -> float:
+def calculate_volatility(returns: Sequence[float] | FloatArray) -> float:
     """
     Calculate annualized volatility (standard deviation of returns)
 
     Args:
-        returns: List of daily returns as decimals
+        returns: Daily returns as decimals (list or NumPy array)
 
     Returns:
         Annualized volatility (standard deviation * sqrt(252))
@@ -90,36 +116,22 @@ def calculate_volatility(returns: list[float]) -> float:
     Raises:
         ValueError: If returns list is empty
     """
-    if not returns:
+    if len(returns) == 0:
         raise ValueError("Returns list cannot be empty")
 
-    if len(returns) == 1:
-        return 0.0
-
-    # Calculate mean
-    mean = sum(returns) / len(returns)
-
-    # Calculate variance
-    squared_diffs = [(r - mean) ** 2 for r in returns]
-    variance = sum(squared_diffs) / (len(returns) - 1)  # Sample variance
-
-    # Standard deviation
-    std_dev = variance**0.5
+    return _annualized_volatility(np.asarray(returns, dtype=np.float64))
 
-    # Annualize (252 trading days per year)
-    annualized_volatility = std_dev * (252**0.5)
 
-    return float(annualized_volatility)
-
-
-def calculate_sharpe_ratio(returns: list[float], risk_free_rate: float = 0.02) -> float:
+def calculate_sharpe_ratio(
+    returns: Sequence[float] | FloatArray, risk_free_rate: float = 0.02
+) -> float:
     """
     Calculate Sharpe Ratio (risk-adjusted return)
 
     Formula: (annual_return - risk_free_rate) / volatility
 
     Args:
-        returns: List of daily returns as decimals
+        returns: Daily returns as decimals (list or NumPy array)
         risk_free_rate: Annual risk-free rate (default: 2%)
 
     Returns:
@@ -129,15 +141,17 @@ def calculate_sharpe_ratio(returns: list[float], risk_free_rate: float = 0.02) -
     Raises:
         ValueError: If returns list is empty
     """
-    if not returns:
+    if len(returns) == 0:
         raise ValueError("Returns list cannot be empty")
 
+    # Convert once, shared by mean and volatility
+    arr = np.asarray(returns, dtype=np.float64)
+
     # Calculate annualized return
-    mean_daily_return = sum(returns) / len(returns)
-    annual_return = mean_daily_return * 252
+    annual_return = float(arr.mean()) * TRADING_DAYS_PER_YEAR
 
     # Calculate volatility
-    volatility = calculate_volatility(returns)
+    volatility = _annualized_volatility(arr)
 
     # Avoid division by zero
     if volatility == 0:
@@ -146,6 +160,53 @@ def calculate_sharpe_ratio(returns: list[float], risk_free_rate: float = 0.02) -
     return (annual_return - risk_free_rate) / volatility
 
 
+def calculate_risk_metrics(
+    values: Sequence[float] | FloatArray, risk_free_rate: float = 0.02
+) -> tuple[float, float, float]:
+    """
+    Calculate max drawdown, volatility and Sharpe ratio of a value series
+
+    Same results as calling calculate_max_drawdown, calculate_volatility and
+    calculate_sharpe_ratio separately, but daily returns are derived once and
+    their mean and deviation are shared by volatility and Sharpe.
+
+    Args:
+        values: Portfolio values over time (list or NumPy array)
+        risk_free_rate: Annual risk-free rate (default: 2%)
+
+    Returns:
+        Tuple of (max_drawdown, volatility, sharpe_ratio)
+        Volatility and Sharpe are 0 if there are fewer than 2 daily returns
+
+    Raises:
+        ValueError: If values list is empty
+    """
+    if len(values) == 0:
+        raise ValueError("Values list cannot be empty")
+
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 1:
+        return 0.0, 0.0, 0.0
+
+    max_dd = _max_drawdown(arr)
+
+    returns = _daily_returns(arr)
+    if returns.size < 2:
+        return max_dd, 0.0, 0.0
+
+    # Mean and deviations computed once, shared by volatility and Sharpe
+    mean = float(returns.mean())
+    deviations = returns - mean
+    variance = float(np.dot(deviations, deviations)) / (returns.size - 1)
+    volatility = math.sqrt(variance) * _SQRT_TRADING_DAYS
+
+    if volatility == 0:
+        return max_dd, 0.0, 0.0
+
+    sharpe_ratio = (mean * TRADING_DAYS_PER_YEAR - risk_free_rate) / volatility
+    return max_dd, volatility, sharpe_ratio
+
+
 def calculate_comparison(results: list[BacktestResult]) -> Comparison:
     """
     Compare multiple backtest results to find best performers
@@ -162,21 +223,27 @@ def calculate_comparison(results: list[BacktestResult]) -> Comparison:
     if not results:
         raise ValueError("Results list cannot be empty")
 
-    # Find best in each category
-    best_return = max(results, key=lambda r: r.total_return)
-    best_sharpe = max(results, key=lambda r: r.sharpe_ratio)
-    lowest_risk = min(results, key=lambda r: r.volatility)
-    best_cagr = max(results, key=lambda r: r.cagr)
-
-    # Find overall best and worst performers (by total return)
-    best_performer_result = max(results, key=lambda r: r.total_return)
-    worst_performer_result = min(results, key=lambda r: r.total_return)
+    # Find best/worst in each category and the totals in a single pass
+    # (strict comparisons keep the first result on ties, like max/min)
+    best_return = worst_return = best_sharpe = lowest_risk = best_cagr = results[0]
+    return_sum = 0.0
+    total_invested = 0.0
+    for r in results:
+        if r.total_return > best_return.total_return:
+            best_return = r
+        if r.total_return < worst_return.total_return:
+            worst_return = r
+        if r.sharpe_ratio > best_sharpe.sharpe_ratio:
+            best_sharpe = r
+        if r.volatility < lowest_risk.volatility:
+            lowest_risk = r
+        if r.cagr > best_cagr.cagr:
+            best_cagr = r
+        return_sum += r.total_return
+        total_invested += r.total_invested
 
     # Calculate average return
-    average_return = sum(r.total_return for r in results) / len(results)
-
-    # Calculate total invested (sum of all investments)
-    total_invested = sum(r.total_invested for r in results)
+    average_return = return_sum / len(results)
 
     return Comparison(
         best_return=best_return.symbol,
@@ -184,12 +251,12 @@ def calculate_comparison(results: list[BacktestResult]) -> Comparison:
         lowest_risk=lowest_risk.symbol,
         best_cagr=best_cagr.symbol,
         best_performer=PerformerInfo(
-            symbol=best_performer_result.symbol,
-            total_return=best_performer_result.total_return,
+            symbol=best_return.symbol,
+            total_return=best_return.total_return,
         ),
         worst_performer=PerformerInfo(
-            symbol=worst_performer_result.symbol,
-            total_return=worst_performer_result.total_return,
+            symbol=worst_return.symbol,
+            total_return=worst_return.total_return,
         ),
         average_return=average_return,
         total_invested=total_invested,
@@ -2,15 +2,22 @@
 Domain Models - Immutable data structures
 
 All models are frozen dataclasses to ensure immutability.
-No external dependencies allowed in this layer.
+They use __slots__ so the thousands of snapshots built per backtest carry
+no per-instance __dict__.
+No external dependencies allowed in this layer (NumPy only, for the
+columnar price and portfolio histories).
 """
 
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from typing import Literal, overload
 
+import numpy as np
+import numpy.typing as npt
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StockPrice:
     """Single point in time stock price data"""
 
@@ -23,7 +30,68 @@ class StockPrice:
             raise ValueError(f"Price must be positive, got {self.close}")
 
 
-@dataclass(frozen=True)
+class PriceSeries(Sequence[StockPrice]):
+    """
+    Price history stored column-wise (dates and closes as NumPy arrays)
+
+    Behaves like a read-only list of StockPrice, but StockPrice objects are
+    only created when the series is indexed or iterated. Backtests read the
+    columns directly.
+
+    The columns are read-only views, not copies: when the caller's arrays
+    already have the stored dtypes, later writes to them show through in the
+    series. Callers hand over their arrays and must not modify them afterwards.
+    """
+
+    __slots__ = ("closes", "dates")
+
+    def __init__(
+        self,
+        dates: npt.NDArray[np.datetime64],
+        closes: npt.NDArray[np.float64],
+    ) -> None:
+        """
+        Initialize series from equally sized columns
+
+        Args:
+            dates: Price dates (naive wall-clock time, stored as datetime64[us])
+            closes: Closing prices
+
+        Raises:
+            ValueError: If columns have different lengths or a price is not positive
+        """
+        if len(dates) != len(closes):
+            raise ValueError("Price columns must have the same length")
+        if not np.all(closes > 0):
+            raise ValueError("Prices must be positive")
+
+        # Read-only views: the series is immutable like the rest of the domain
+        # models, while the caller's own arrays stay writable
+        self.dates = dates.astype("datetime64[us]", copy=False).view()
+        self.closes = closes.astype(np.float64, copy=False).view()
+        self.dates.flags.writeable = False
+        self.closes.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.closes)
+
+    @overload
+    def __getitem__(self, index: int) -> StockPrice: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[StockPrice]: ...
+
+    def __getitem__(self, index: int | slice) -> StockPrice | list[StockPrice]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return StockPrice(date=self.dates[index].item(), close=float(self.closes[index]))
+
+    def __iter__(self) -> Iterator[StockPrice]:
+        return map(StockPrice, self.dates.tolist(), self.closes.tolist())
+
+
+@dataclass(frozen=True, slots=True)
 class PortfolioSnapshot:
     """Portfolio state at a specific point in time"""
 
@@ -43,8 +111,113 @@ class PortfolioSnapshot:
                 f"Cumulative invested cannot be negative, got {self.cumulative_invested}"
             )
 
+    @classmethod
+    def _unsafe_new(
+        cls,
+        date: datetime,
+        value: float,
+        shares: float,
+        cumulative_invested: float,
+    ) -> "PortfolioSnapshot":
+        """
+        Create snapshot without running validation
+
+        Only for trusted callers whose inputs are valid by construction
+        (e.g. backtest functions computing value = shares * close from
+        validated positive inputs).
+        """
+        snapshot = object.__new__(cls)
+        object.__setattr__(snapshot, "date", date)
+        object.__setattr__(snapshot, "value", value)
+        object.__setattr__(snapshot, "shares", shares)
+        object.__setattr__(snapshot, "cumulative_invested", cumulative_invested)
+        return snapshot
+
+
+class PortfolioHistory(Sequence[PortfolioSnapshot]):
+    """
+    Portfolio history stored column-wise (one NumPy array per field)
+
+    Behaves like a read-only list of PortfolioSnapshot, but snapshots are
+    only created when the history is indexed or iterated. Consumers that
+    only need the numbers can read the columns directly.
+
+    The columns are read-only views of the caller's arrays, not copies, so
+    later writes to those arrays show through in the history. Callers hand
+    over their arrays and must not modify them afterwards.
+    """
+
+    __slots__ = ("cumulative_invested", "dates", "shares", "values")
+
+    def __init__(
+        self,
+        dates: npt.NDArray[np.datetime64],
+        values: npt.NDArray[np.float64],
+        shares: npt.NDArray[np.float64],
+        cumulative_invested: npt.NDArray[np.float64],
+    ) -> None:
+        """
+        Initialize history from equally sized columns
+
+        Args:
+            dates: Snapshot dates as datetime64[us]
+            values: Portfolio value per day
+            shares: Total shares held per day
+            cumulative_invested: Total amount invested so far per day
+
+        Raises:
+            ValueError: If columns have different lengths
+        """
+        if not len(dates) == len(values) == len(shares) == len(cumulative_invested):
+            raise ValueError("History columns must have the same length")
+
+        # Read-only views: the history is immutable like the rest of the domain
+        # models, while the caller's own arrays stay writable
+        self.dates = dates.view()
+        self.values = values.view()
+        self.shares = shares.view()
+        self.cumulative_invested = cumulative_invested.view()
+        for column in (self.dates, self.values, self.shares, self.cumulative_invested):
+            column.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> PortfolioSnapshot: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[PortfolioSnapshot]: ...
+
+    def __getitem__(self, index: int | slice) -> PortfolioSnapshot | list[PortfolioSnapshot]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return PortfolioSnapshot._unsafe_new(
+            date=self.dates[index].item(),
+            value=float(self.values[index]),
+            shares=float(self.shares[index]),
+            cumulative_invested=float(self.cumulative_invested[index]),
+        )
+
+    def __iter__(self) -> Iterator[PortfolioSnapshot]:
+        for date, value, shares, invested in self.rows():
+            yield PortfolioSnapshot._unsafe_new(
+                date=date, value=value, shares=shares, cumulative_invested=invested
+            )
+
+    def rows(self) -> Iterator[tuple[datetime, float, float, float]]:
+        """Iterate (date, value, shares, cumulative_invested) tuples without building snapshots"""
+        return zip(
+            self.dates.tolist(),
+            self.values.tolist(),
+            self.shares.tolist(),
+            self.cumulative_invested.tolist(),
+            strict=True,
+        )
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BacktestResult:
     """Complete backtest result with all metrics"""
 
@@ -66,13 +239,13 @@ class BacktestResult:
     final_value: float
     total_invested: float
 
-    # Historical data
-    history: list[PortfolioSnapshot]
+    # Historical data (a list or a columnar PortfolioHistory)
+    history: Sequence[PortfolioSnapshot]
 
     def __post_init__(self) -> None:
         """Validate data on initialization"""
         # Note: symbol and name can be empty strings (for unnamed backtests)
-        if self.strategy not in ("lump_sum", "dca"):
+        if self.strategy not in {"lump_sum", "dca"}:
             raise ValueError(f"Invalid strategy: {self.strategy}")
         if self.final_value < 0:
             raise ValueError(f"Final value cannot be negative, got {self.final_value}")
@@ -84,7 +257,7 @@ class BacktestResult:
             raise ValueError(f"Max drawdown must be negative or zero, got {self.max_drawdown}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PerformerInfo:
     """Information about a performer in comparison"""
 
@@ -97,7 +270,7 @@ class PerformerInfo:
             raise ValueError("Symbol cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comparison:
     """Comparison metrics across multiple backtests"""
 
@@ -2,14 +2,60 @@
 Simple File-Based Cache for Stock Data
 
 Caches Yahoo Finance API responses to avoid rate limiting.
-Uses JSON files stored in .cache/ directory with 24-hour TTL.
+Uses MessagePack files stored in .cache/ directory with 24-hour TTL
+(measured from each file's modification time).
 """
 
+import contextlib
 import hashlib
-import json
-from datetime import datetime, timedelta
+import os
+import tempfile
+import time
+from collections.abc import Iterator, Sequence
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Any, cast
+
+import msgspec
+import numpy as np
+import numpy.typing as npt
+
+from domain.models import PriceSeries, StockPrice
+
+# Fixed (little-endian) layouts of the raw array bytes stored in cache files
+_DATES_DTYPE = np.dtype("<M8[us]")
+_CLOSES_DTYPE = np.dtype("<f8")
+
+# File suffix of price entries
+_ENTRY_SUFFIX = ".msgpack"
+
+
+class CacheEntry(msgspec.Struct):
+    """
+    Cached stock data for one (symbol, start, end) request
+
+    Prices are stored column-wise as raw array bytes, so reading them back
+    is a zero-copy view instead of one object per trading day.
+    """
+
+    stock_name: str
+    dates: bytes
+    closes: bytes
+
+    def date_array(self) -> npt.NDArray[np.datetime64]:
+        """Trading dates as datetime64[us] (naive wall-clock time)"""
+        return np.frombuffer(self.dates, dtype=_DATES_DTYPE)
+
+    def close_array(self) -> npt.NDArray[np.float64]:
+        """Closing prices as float64"""
+        return np.frombuffer(self.closes, dtype=_CLOSES_DTYPE)
+
+    def prices(self) -> PriceSeries:
+        """Cached prices as a columnar series (views of the stored bytes)"""
+        return PriceSeries(self.date_array(), self.close_array())
+
+
+_ENCODER = msgspec.msgpack.Encoder()
+_ENTRY_DECODER = msgspec.msgpack.Decoder(CacheEntry)
 
 
 class StockCache:
@@ -43,14 +89,53 @@ class StockCache:
         """
         key_str = f"{symbol}_{start_date}_{end_date}"
         # Use hash to avoid filesystem issues with special characters
-        # MD5 is used for cache key generation, not security
-        return hashlib.md5(key_str.encode(), usedforsecurity=False).hexdigest()
+        # BLAKE2 (built into hashlib, no OpenSSL dispatch) is cheaper than MD5
+        # for these short keys; it is a file name, not a security measure
+        return hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
 
     def _get_cache_path(self, cache_key: str) -> Path:
-        """Get full path to cache file"""
-        return self.cache_dir / f"{cache_key}.json"
+        """
+        Get full path to cache file
+
+        Files are sharded into 256 subdirectories by the first two hex
+        characters of the key (like git objects), keeping directories small.
+        """
+        return self.cache_dir / cache_key[:2] / f"{cache_key[2:]}{_ENTRY_SUFFIX}"
+
+    def _is_expired(self, mtime: float) -> bool:
+        """Whether a cache file last written at mtime is past the TTL"""
+        return time.time() - mtime > self.ttl.total_seconds()
 
-    def get(self, symbol: str, start_date: datetime, end_date: datetime) -> dict[str, Any] | None:
+    def _iter_cache_files(self) -> Iterator[os.DirEntry[str]]:
+        """Iterate over all cache files in all shard directories"""
+        with os.scandir(self.cache_dir) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(_ENTRY_SUFFIX):
+                            yield entry
+
+    def path_for(self, symbol: str, start_date: date, end_date: date) -> Path:
+        """
+        Get the cache file path for a request
+
+        Callers that read and then write the same entry can derive the path
+        once and use get_by_path/set_by_path.
+
+        Args:
+            symbol: Stock symbol
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            Path of the cache file
+        """
+        cache_key = self._get_cache_key(symbol, start_date.isoformat(), end_date.isoformat())
+        return self._get_cache_path(cache_key)
+
+    def get(self, symbol: str, start_date: date, end_date: date) -> CacheEntry | None:
         """
         Retrieve cached data if available and not expired
 
@@ -60,41 +145,55 @@ class StockCache:
             end_date: End date
 
         Returns:
-            Cached data dict or None if not found/expired
+            Cached entry or None if not found/expired
         """
-        try:
-            cache_key = self._get_cache_key(
-                symbol, start_date.date().isoformat(), end_date.date().isoformat()
-            )
-            cache_path = self._get_cache_path(cache_key)
+        return self.get_by_path(self.path_for(symbol, start_date, end_date))
+
+    def get_by_path(self, cache_path: Path) -> CacheEntry | None:
+        """
+        Retrieve cached data from a path returned by path_for
 
-            # Check if cache file exists
-            if not cache_path.exists():
-                return None
+        Args:
+            cache_path: Cache file path
 
-            # Read cache file
-            with open(cache_path, encoding="utf-8") as f:
-                cached_data = json.load(f)
+        Returns:
+            Cached entry or None if not found/expired
+        """
+        # Check existence and expiration with a single stat, before reading
+        try:
+            mtime = cache_path.stat().st_mtime
+        except OSError:
+            return None
 
-            # Check expiration
-            cached_time = datetime.fromisoformat(cached_data["cached_at"])
-            if datetime.now() - cached_time > self.ttl:
-                # Cache expired, delete file
+        if self._is_expired(mtime):
+            # Cache expired, delete file
+            with contextlib.suppress(OSError):
                 cache_path.unlink()
-                return None
+            return None
+
+        return self._read_file(cache_path)
 
-            return cast("dict[str, Any]", cached_data["data"])
+    @staticmethod
+    def _read_file(cache_path: Path) -> CacheEntry | None:
+        """
+        Read and decode a cache file (decoded straight into structs)
 
-        except Exception:
-            # If any error occurs, treat as cache miss
+        Returns:
+            Cached entry, or None if the file is unreadable or corrupt
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                return _ENTRY_DECODER.decode(f.read())
+        except (OSError, msgspec.DecodeError):
             return None
 
     def set(
         self,
         symbol: str,
-        start_date: datetime,
-        end_date: datetime,
-        data: dict[str, Any],
+        start_date: date,
+        end_date: date,
+        prices: Sequence[StockPrice],
+        stock_name: str,
     ) -> None:
         """
         Store data in cache
@@ -103,24 +202,64 @@ class StockCache:
             symbol: Stock symbol
             start_date: Start date
             end_date: End date
-            data: Data to cache
+            prices: Daily prices to cache
+            stock_name: Full stock name
         """
-        try:
-            cache_key = self._get_cache_key(
-                symbol, start_date.date().isoformat(), end_date.date().isoformat()
+        self.set_by_path(self.path_for(symbol, start_date, end_date), prices, stock_name)
+
+    def set_by_path(
+        self,
+        cache_path: Path,
+        prices: Sequence[StockPrice],
+        stock_name: str,
+    ) -> None:
+        """
+        Store data at a path returned by path_for
+
+        Dates are stored as naive wall-clock time (timezone info dropped).
+
+        Args:
+            cache_path: Cache file path
+            prices: Daily prices to cache
+            stock_name: Full stock name
+        """
+        # Prepare cache entry, packing prices straight into column bytes
+        if isinstance(prices, PriceSeries):
+            dates = prices.dates.astype(_DATES_DTYPE, copy=False)
+            closes = prices.closes.astype(_CLOSES_DTYPE, copy=False)
+        else:
+            count = len(prices)
+            dates = np.fromiter(
+                (p.date.replace(tzinfo=None) for p in prices), dtype=_DATES_DTYPE, count=count
             )
-            cache_path = self._get_cache_path(cache_key)
+            closes = np.fromiter((p.close for p in prices), dtype=_CLOSES_DTYPE, count=count)
+        entry = CacheEntry(
+            stock_name=stock_name,
+            dates=dates.tobytes(),
+            closes=closes.tobytes(),
+        )
 
-            # Prepare cache entry
-            cache_entry = {"cached_at": datetime.now().isoformat(), "data": data}
+        # Silently fail - caching is optional
+        with contextlib.suppress(OSError):
+            self._write_file(cache_path, _ENCODER.encode(entry))
 
-            # Write to file
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_entry, f, ensure_ascii=False, indent=2)
+    @staticmethod
+    def _write_file(cache_path: Path, data: bytes) -> None:
+        """
+        Write a cache file atomically
 
-        except Exception:
-            # Silently fail - caching is optional
-            pass
+        Data goes to a temporary file that is then moved into place, so
+        readers never see a half-written file.
+        """
+        cache_path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     def clear_expired(self) -> int:
         """
@@ -131,21 +270,18 @@ class StockCache:
         """
         removed = 0
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
+            for entry in self._iter_cache_files():
+                # The write time is the file's mtime, so no file is opened here
                 try:
-                    with open(cache_file, encoding="utf-8") as f:
-                        cached_data = json.load(f)
-
-                    cached_time = datetime.fromisoformat(cached_data["cached_at"])
-                    if datetime.now() - cached_time > self.ttl:
-                        cache_file.unlink()
+                    if self._is_expired(entry.stat().st_mtime):
+                        os.unlink(entry.path)
                         removed += 1
-                except Exception:
-                    # If file is corrupted, delete it
-                    cache_file.unlink()
-                    removed += 1
-        except Exception:
-            pass
+                except OSError:
+                    # Already removed by a concurrent reader, or not ours to
+                    # remove: skip this file and keep sweeping
+                    continue
+        except OSError:
+            pass  # Cache directory missing or unreadable
 
         return removed
 
@@ -158,10 +294,13 @@ class StockCache:
         """
         removed = 0
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
-                removed += 1
-        except Exception:
-            pass
+            for entry in self._iter_cache_files():
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except OSError:
+                    continue  # Skip this file and keep sweeping
+        except OSError:
+            pass  # Cache directory missing or unreadable
 
         return removed
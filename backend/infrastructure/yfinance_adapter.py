@@ -8,14 +8,29 @@ This layer contains all side effects:
 - Caching to avoid rate limiting
 """
 
-from datetime import datetime
-
+import asyncio
+import contextlib
+from concurrent.futures import Executor
+from datetime import date, datetime, time, timedelta
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import orjson
 import requests
-import yfinance as yf
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from domain.models import StockPrice
+from domain.models import PriceSeries
 from infrastructure.cache import StockCache
 
+if TYPE_CHECKING:
+    import yfinance as yf
+
+# Yahoo Finance chart API (daily prices and metadata for one symbol)
+_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/"
+
 
 class StockDataError(Exception):
     """Raised when stock data cannot be fetched or is invalid"""
@@ -23,16 +38,45 @@ class StockDataError(Exception):
     pass
 
 
+class NoDataError(StockDataError):
+    """Raised when Yahoo Finance has no (or too little) data for a symbol"""
+
+    pass
+
+
+def _ticker(symbol: str) -> "yf.Ticker":
+    """
+    Create a yfinance Ticker
+
+    yfinance (and pandas with it) is slow to import and only needed when the
+    chart API fails or a name lookup misses, so it is imported on first use.
+    """
+    import yfinance as yf
+
+    return yf.Ticker(symbol)
+
+
+def _as_date(value: date) -> date:
+    """Calendar date of a date or datetime"""
+    return value.date() if isinstance(value, datetime) else value
+
+
 class YFinanceAdapter:
     """Adapter for Yahoo Finance API using yfinance library with caching"""
 
-    def __init__(self, cache_enabled: bool = True, cache_ttl_hours: int = 24):
+    def __init__(
+        self,
+        cache_enabled: bool = True,
+        cache_ttl_hours: int = 24,
+        session: requests.Session | None = None,
+    ):
         """
         Initialize adapter
 
         Args:
             cache_enabled: Whether to enable caching (default: True)
             cache_ttl_hours: Cache time-to-live in hours (default: 24)
+            session: HTTP session to use (default: a new pooled session)
         """
         self.cache_enabled = cache_enabled
         self.cache: StockCache | None
@@ -41,20 +85,76 @@ class YFinanceAdapter:
         else:
             self.cache = None
 
+        # In-memory cache in front of the file cache, shared by all requests
+        # using this adapter (guarded by a lock, adapters are used from threads)
+        self._memory_cache: TTLCache[tuple[str, date, date], tuple[PriceSeries, str]] = TTLCache(
+            maxsize=1024, ttl=cache_ttl_hours * 3600
+        )
+        # Recent "no data" answers (e.g. unknown or delisted symbols), kept
+        # briefly so repeated requests fail fast instead of hitting the network
+        # again. Transport errors are not kept: the next request retries.
+        self._failure_cache: TTLCache[tuple[str, date, date], str] = TTLCache(maxsize=1024, ttl=300)
+        # Stock names by symbol (names rarely change, so they are kept for a week)
+        self._names: TTLCache[str, str] = TTLCache(maxsize=1024, ttl=7 * 24 * 3600)
+        self._memory_lock = Lock()
+
+        # Fetches currently running for get_stock_data_async (event loop thread only)
+        self._inflight: dict[tuple[str, date, date], asyncio.Future[tuple[PriceSeries, str]]] = {}
+
         # Setup requests session with headers
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.session = session if session is not None else self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create a keep-alive session for Yahoo Finance
+
+        The connection pool is sized for concurrent fetches from worker
+        threads, so connections (and their TLS handshakes) are reused
+        instead of being dropped when more than the default 10 are in use.
+        Transient failures are retried on the same session, which is cheaper
+        than falling back to yfinance.
+        """
+        session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504))
+        pool = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+        session.mount("https://", pool)
+        session.mount("http://", pool)
+        session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
         )
+        return session
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
+
+    def invalidate(self, symbol: str | None = None) -> None:
+        """
+        Drop in-memory cached data and remembered failures
+
+        The file cache is left alone (see StockCache.clear_all).
+
+        Args:
+            symbol: Only drop entries for this symbol (default: drop everything)
+        """
+        with self._memory_lock:
+            if symbol is None:
+                self._memory_cache.clear()
+                self._failure_cache.clear()
+                return
+            for cache in (self._memory_cache, self._failure_cache):
+                for key in [key for key in cache if key[0] == symbol]:
+                    cache.pop(key, None)
 
     def _fetch_with_requests(
         self,
         symbol: str,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> tuple[list[StockPrice], str] | None:
+        start_date: date,
+        end_date: date,
+    ) -> tuple[PriceSeries, str] | None:
         """
         Fetch data directly using requests library (bypass yfinance)
 
@@ -62,42 +162,40 @@ class YFinanceAdapter:
 
         Args:
             symbol: Stock ticker symbol
-            start_date: Start date
-            end_date: End date
+            start_date: First day to include
+            end_date: Last day to include
 
         Returns:
             Tuple of (prices, stock_name) or None if failed
         """
         try:
-            url = "https://query1.finance.yahoo.com/v8/finance/chart/" + symbol
-            params = {
-                "period1": int(start_date.timestamp()),
-                "period2": int(end_date.timestamp()),
-                "interval": "1d",
-            }
+            # Whole days: from start midnight up to (not including) the day after end
+            period1 = int(datetime.combine(start_date, time.min).timestamp())
+            period2 = int(datetime.combine(end_date + timedelta(days=1), time.min).timestamp())
+            url = f"{_CHART_URL}{symbol}?period1={period1}&period2={period2}&interval=1d"
 
-            response = self.session.get(url, params=params, timeout=10)  # type: ignore[arg-type]
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            # Parse the raw bytes directly (skips requests' text decoding)
+            data = orjson.loads(response.content)
             result = data["chart"]["result"][0]
 
             # Extract stock metadata
             meta = result.get("meta", {})
-            stock_name = meta.get("longName") or meta.get("shortName") or symbol
+            stock_name = self._remember_name(symbol, meta)
+
+            # Extract price data as arrays (missing closes become NaN)
+            timestamps = np.asarray(result["timestamp"], dtype=np.int64)
+            closes = np.array(result["indicators"]["quote"][0]["close"], dtype=np.float64)
+            valid = ~np.isnan(closes)  # Skip days with no data
 
-            # Extract price data
-            timestamps = result["timestamp"]
-            quotes = result["indicators"]["quote"][0]
-            closes = quotes["close"]
+            # Timestamps are UTC seconds; shift them to the exchange's wall-clock
+            # time so every price lands on its local trading day
+            offset = int(meta.get("gmtoffset", 0))
+            dates = (timestamps[valid] + offset).astype("datetime64[s]")
 
-            # Convert to StockPrice objects
-            prices = []
-            for i, timestamp in enumerate(timestamps):
-                if closes[i] is not None:  # Skip days with no data
-                    prices.append(
-                        StockPrice(date=datetime.fromtimestamp(timestamp), close=float(closes[i]))
-                    )
+            prices = PriceSeries(dates, closes[valid])
 
             if len(prices) < 10:
                 return None
@@ -111,35 +209,128 @@ class YFinanceAdapter:
     def get_stock_data(
         self,
         symbol: str,
-        start_date: datetime,
-        end_date: datetime,
-    ) -> tuple[list[StockPrice], str]:
+        start_date: date,
+        end_date: date,
+    ) -> tuple[PriceSeries, str]:
         """
         Fetch stock price data from Yahoo Finance (with caching)
 
+        Results are kept in memory first, then in the file cache. Symbols
+        without data are remembered for a few minutes and raised again without
+        refetching; other failures are not remembered.
+        Only the calendar dates matter; datetimes are truncated to their date.
+
         Args:
             symbol: Stock ticker symbol (e.g., "AAPL", "2330.TW")
-            start_date: Start date for historical data
-            end_date: End date for historical data
+            start_date: First day of historical data
+            end_date: Last day of historical data (inclusive)
 
         Returns:
             Tuple of (prices, stock_name):
-            - prices: List of StockPrice objects
+            - prices: Daily prices as a columnar PriceSeries
             - stock_name: Full name of the stock
 
         Raises:
+            NoDataError: If Yahoo Finance has no (or too little) data
             StockDataError: If data cannot be fetched or is invalid
         """
-        # Try to get from cache first
+        start_date, end_date = _as_date(start_date), _as_date(end_date)
+        if not self.cache_enabled:
+            return self._load_stock_data(symbol, start_date, end_date)
+
+        key = (symbol, start_date, end_date)
+        with self._memory_lock:
+            cached = self._memory_cache.get(key)
+            failure = self._failure_cache.get(key)
+
+        if failure is not None:
+            raise NoDataError(failure)
+
+        if cached is None:
+            try:
+                cached = self._load_stock_data(symbol, start_date, end_date)
+            except NoDataError as e:
+                with self._memory_lock:
+                    self._failure_cache[key] = str(e)
+                raise
+            with self._memory_lock:
+                self._memory_cache[key] = cached
+
+        # Price series are immutable, so the cached entry is returned as is
+        return cached
+
+    async def get_stock_data_async(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        executor: Executor | None = None,
+    ) -> tuple[PriceSeries, str]:
+        """
+        Async variant of get_stock_data that coalesces identical requests
+
+        The blocking fetch runs in the given executor. While a fetch for the
+        same (symbol, start, end) is in flight, later callers await it
+        instead of starting their own download.
+
+        Args:
+            symbol: Stock ticker symbol (e.g., "AAPL", "2330.TW")
+            start_date: First day of historical data
+            end_date: Last day of historical data (inclusive)
+            executor: Executor for the blocking fetch (default: loop's executor)
+
+        Returns:
+            Tuple of (prices, stock_name)
+
+        Raises:
+            StockDataError: If data cannot be fetched or is invalid
+        """
+        start_date, end_date = _as_date(start_date), _as_date(end_date)
+        key = (symbol, start_date, end_date)
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                executor, self.get_stock_data, symbol, start_date, end_date
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(future)
+
+    def _load_stock_data(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+    ) -> tuple[PriceSeries, str]:
+        """
+        Load stock price data from the file cache or Yahoo Finance
+
+        Args:
+            symbol: Stock ticker symbol (e.g., "AAPL", "2330.TW")
+            start_date: First day of historical data
+            end_date: Last day of historical data (inclusive)
+
+        Returns:
+            Tuple of (prices, stock_name):
+            - prices: Daily prices as a columnar PriceSeries
+            - stock_name: Full name of the stock
+
+        Raises:
+            StockDataError: If data cannot be fetched or is invalid
+        """
+        # Try to get from cache first (path derived once for read and write)
+        cache_path = None
         if self.cache_enabled and self.cache:
-            cached_data = self.cache.get(symbol, start_date, end_date)
-            if cached_data is not None:
-                # Reconstruct StockPrice objects from cached data
-                prices = [
-                    StockPrice(date=datetime.fromisoformat(p["date"]), close=p["close"])
-                    for p in cached_data["prices"]
-                ]
-                return prices, cached_data["stock_name"]
+            cache_path = self.cache.path_for(symbol, start_date, end_date)
+            cached = self.cache.get_by_path(cache_path)
+            if cached is not None:
+                # Columns that do not form a valid series (e.g. a truncated
+                # blob) are treated as a miss and refetched
+                with contextlib.suppress(ValueError):
+                    return cached.prices(), cached.stock_name
 
         # Try to fetch using requests first (more reliable)
         result = self._fetch_with_requests(symbol, start_date, end_date)
@@ -147,63 +338,53 @@ class YFinanceAdapter:
             prices, stock_name = result
 
             # Store in cache before returning
-            if self.cache_enabled and self.cache:
-                cache_data = {
-                    "prices": [{"date": p.date.isoformat(), "close": p.close} for p in prices],
-                    "stock_name": stock_name,
-                }
-                self.cache.set(symbol, start_date, end_date, cache_data)
+            if self.cache and cache_path is not None:
+                self.cache.set_by_path(cache_path, prices, stock_name)
 
             return prices, stock_name
 
         # Fallback to yfinance if requests method fails
         try:
             # Fetch data from Yahoo Finance
-            ticker = yf.Ticker(symbol)
+            ticker = _ticker(symbol)
 
-            # Get historical prices
-            df = ticker.history(start=start_date, end=end_date)
+            # Get historical prices (dividends/splits are not needed)
+            # yfinance treats end as exclusive
+            df = ticker.history(start=start_date, end=end_date + timedelta(days=1), actions=False)
 
             # Check if data is empty
             if df.empty:
-                raise StockDataError(
-                    f"No data available for {symbol} between {start_date.date()} and {end_date.date()}"
+                raise NoDataError(
+                    f"No data available for {symbol} between {start_date} and {end_date}"
                 )
 
-            # Get stock name
+            # Get stock name from the chart metadata that came with the history
+            # (ticker.info would cost another, much heavier request)
             try:
-                stock_info = ticker.info
-                stock_name = stock_info.get("longName") or stock_info.get("shortName") or symbol
+                stock_name = self._remember_name(symbol, ticker.history_metadata)
             except Exception:
-                # If info fetch fails, just use symbol
+                # If metadata is unavailable, just use symbol
                 stock_name = symbol
 
-            # Convert to domain models
-            prices = []
-            for date, row in df.iterrows():
-                try:
-                    price = StockPrice(
-                        date=date.to_pydatetime(),
-                        close=float(row["Close"]),
-                    )
-                    prices.append(price)
-                except (KeyError, ValueError, TypeError):
-                    # Skip invalid rows
-                    continue
+            # Convert to a price series, skipping rows without a valid close
+            # (NaN fails the comparison too)
+            closes = df["Close"].to_numpy(dtype=np.float64)
+            valid = closes > 0
+            index = df.index[valid]
+            if index.tz is not None:
+                # Exchange wall-clock time, like the chart API path and the cache
+                index = index.tz_localize(None)
+            prices = PriceSeries(index.to_numpy(dtype="datetime64[us]"), closes[valid])
 
             # Validate we have sufficient data
             if len(prices) < 10:
-                raise StockDataError(
+                raise NoDataError(
                     f"Insufficient data for {symbol}: only {len(prices)} trading days found"
                 )
 
             # Store in cache before returning
-            if self.cache_enabled and self.cache:
-                cache_data = {
-                    "prices": [{"date": p.date.isoformat(), "close": p.close} for p in prices],
-                    "stock_name": stock_name,
-                }
-                self.cache.set(symbol, start_date, end_date, cache_data)
+            if self.cache and cache_path is not None:
+                self.cache.set_by_path(cache_path, prices, stock_name)
 
             return prices, stock_name
 
@@ -227,9 +408,33 @@ class YFinanceAdapter:
         Raises:
             StockDataError: If stock info cannot be fetched
         """
+        with self._memory_lock:
+            known = self._names.get(symbol)
+        if known is not None:
+            return known
+
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            return info.get("longName") or info.get("shortName") or symbol
+            ticker = _ticker(symbol)
+            return self._remember_name(symbol, ticker.info)
         except Exception as e:
             raise StockDataError(f"Failed to fetch stock name for {symbol}: {e!s}") from e
+
+    def _remember_name(self, symbol: str, meta: dict[str, Any]) -> str:
+        """
+        Pick the stock name from Yahoo metadata and remember it
+
+        Args:
+            symbol: Stock ticker symbol
+            meta: Chart metadata or ticker info containing longName/shortName
+
+        Returns:
+            Full stock name, or the symbol if the metadata has none
+        """
+        name = meta.get("longName") or meta.get("shortName")
+        if not name:
+            with self._memory_lock:
+                return self._names.get(symbol, symbol)
+
+        with self._memory_lock:
+            self._names[symbol] = name
+        return str(name)
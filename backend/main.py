@@ -4,11 +4,29 @@ FastAPI Application Entry Point
 Main application setup with CORS, routing, and error handling.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from api.routes import router
+from application.backtest_service import BacktestService
+from infrastructure.yfinance_adapter import YFinanceAdapter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the shared adapter and service at startup, close the adapter at shutdown"""
+    adapter = YFinanceAdapter()
+    app.state.yfinance_adapter = adapter
+    app.state.backtest_service = BacktestService(data_adapter=adapter)
+    try:
+        yield
+    finally:
+        adapter.close()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -17,6 +35,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -55,9 +75,9 @@ async def root() -> dict[str, str]:
 
 # Global exception handler
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle uncaught exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": f"Internal server error: {exc!s}"},
     )
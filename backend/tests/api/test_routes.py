@@ -6,31 +6,51 @@ Mocks the service layer to avoid real API calls and calculations.
 """
 
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import create_autospec
 
+import msgspec
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
 from api.dependencies import get_backtest_service
-from domain.models import BacktestResult, Comparison, PerformerInfo, PortfolioSnapshot
+from application.backtest_service import BacktestService
+from domain.models import (
+    BacktestResult,
+    Comparison,
+    PerformerInfo,
+    PortfolioHistory,
+    PortfolioSnapshot,
+)
 from infrastructure.yfinance_adapter import StockDataError
 from main import app
 
+# Valid request body; tests override only the fields under test
+_BODY = {
+    "stocks": ["TEST"],
+    "start_date": "2024-01-01",
+    "end_date": "2024-12-31",
+    "strategy": "lump_sum",
+    "investment": {"amount": 10000.0},
+}
+
 # ============================================================================
 # Fixtures
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """FastAPI test client"""
-    return TestClient(app)
+    """FastAPI test client shared by the module (runs the app lifespan once)"""
+    # mock_service swaps the service per test through dependency overrides
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture
 def mock_service():
-    """Mock BacktestService"""
-    mock = Mock()
+    """Mock BacktestService (autospec, so calls must match the real signatures)"""
+    mock = create_autospec(BacktestService, instance=True)
     # Override dependency
     app.dependency_overrides[get_backtest_service] = lambda: mock
     yield mock
@@ -90,18 +110,15 @@ class TestBacktestEndpoint:
     def test_success_single_stock(self, client, mock_service, sample_result, sample_comparison):
         """Should return 200 and correct response for valid request"""
         # Given
-        mock_service.run_multiple_backtests.return_value = ([sample_result], sample_comparison)
+        mock_service.run_multiple_backtests_async.return_value = (
+            [sample_result],
+            sample_comparison,
+        )
 
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": ["TEST"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
-            },
+            json=_BODY,
         )
 
         # Then
@@ -157,18 +174,15 @@ class TestBacktestEndpoint:
                 )
             ],
         )
-        mock_service.run_multiple_backtests.return_value = ([result1, result2], sample_comparison)
+        mock_service.run_multiple_backtests_async.return_value = (
+            [result1, result2],
+            sample_comparison,
+        )
 
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": ["AAPL", "GOOGL"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
-            },
+            json={**_BODY, "stocks": ["AAPL", "GOOGL"]},
         )
 
         # Then
@@ -201,15 +215,13 @@ class TestBacktestEndpoint:
                 )
             ],
         )
-        mock_service.run_multiple_backtests.return_value = ([dca_result], sample_comparison)
+        mock_service.run_multiple_backtests_async.return_value = ([dca_result], sample_comparison)
 
         # When
         response = client.post(
             "/api/backtest",
             json={
-                "stocks": ["TEST"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
+                **_BODY,
                 "strategy": "dca",
                 "investment": {"amount": 1000.0},
             },
@@ -220,6 +232,112 @@ class TestBacktestEndpoint:
         data = response.json()
         assert data["results"][0]["strategy"] == "dca"
 
+    def test_columnar_history(self, client, mock_service, sample_comparison):
+        """Should serialize a columnar PortfolioHistory like a snapshot list"""
+        # Given
+        result = BacktestResult(
+            symbol="TEST",
+            name="Test Stock",
+            strategy="lump_sum",
+            total_return=0.1,
+            cagr=0.1,
+            max_drawdown=0.0,
+            volatility=0.1,
+            sharpe_ratio=1.0,
+            final_value=11000.0,
+            total_invested=10000.0,
+            history=PortfolioHistory(
+                dates=np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[us]"),
+                values=np.array([10000.0, 11000.0]),
+                shares=np.array([100.0, 100.0]),
+                cumulative_invested=np.array([10000.0, 10000.0]),
+            ),
+        )
+        mock_service.run_multiple_backtests_async.return_value = ([result], sample_comparison)
+
+        # When
+        response = client.post(
+            "/api/backtest",
+            json=_BODY,
+        )
+
+        # Then
+        assert response.status_code == 200
+        history = response.json()["results"][0]["history"]
+        assert history[1] == {
+            "date": "2024-01-02T00:00:00",
+            "value": 11000.0,
+            "shares": 100.0,
+            "cumulative_invested": 10000.0,
+        }
+
+    def test_history_omitted_when_not_requested(
+        self, client, mock_service, sample_result, sample_comparison
+    ):
+        """Should leave out history when include_history is false"""
+        # Given
+        mock_service.run_multiple_backtests_async.return_value = (
+            [sample_result],
+            sample_comparison,
+        )
+
+        # When
+        response = client.post(
+            "/api/backtest",
+            json={**_BODY, "include_history": False},
+        )
+
+        # Then
+        assert response.status_code == 200
+        result = response.json()["results"][0]
+        assert "history" not in result
+        assert result["total_return"] == 0.25
+
+    def test_msgpack_when_accepted(self, client, mock_service, sample_result, sample_comparison):
+        """Should encode the same body as MessagePack when the client accepts it"""
+        # Given
+        mock_service.run_multiple_backtests_async.return_value = (
+            [sample_result],
+            sample_comparison,
+        )
+
+        # When
+        json_response = client.post("/api/backtest", json=_BODY)
+        msgpack_response = client.post(
+            "/api/backtest", json=_BODY, headers={"Accept": "application/msgpack"}
+        )
+
+        # Then
+        assert msgpack_response.status_code == 200
+        assert msgpack_response.headers["content-type"] == "application/msgpack"
+        assert msgspec.msgpack.decode(msgpack_response.content) == json_response.json()
+
+    @pytest.mark.parametrize(
+        ("accept", "media_type"),
+        [
+            ("application/msgpack;q=0", "application/json"),
+            ("application/msgpack;q=0.5, application/json", "application/json"),
+            ("application/json;q=0.5, application/msgpack", "application/msgpack"),
+            ("application/msgpack-stream", "application/json"),
+        ],
+    )
+    def test_accept_q_values(
+        self, client, mock_service, sample_result, sample_comparison, accept, media_type
+    ):
+        """Should honour Accept q-values instead of matching substrings"""
+        # Given
+        mock_service.run_multiple_backtests_async.return_value = (
+            [sample_result],
+            sample_comparison,
+        )
+
+        # When
+        response = client.post("/api/backtest", json=_BODY, headers={"Accept": accept})
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"] == media_type
+
 
 # ============================================================================
 # Tests: Validation Errors (422)
@@ -235,11 +353,9 @@ class TestValidationErrors:
         response = client.post(
             "/api/backtest",
             json={
-                "stocks": ["TEST"],
+                **_BODY,
                 "start_date": "2024-12-31",
                 "end_date": "2024-01-01",  # Before start_date
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
             },
         )
 
@@ -252,13 +368,7 @@ class TestValidationErrors:
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": [],  # Empty list
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
-            },
+            json={**_BODY, "stocks": []},  # Empty list
         )
 
         # Then
@@ -269,13 +379,7 @@ class TestValidationErrors:
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": [f"STOCK{i}" for i in range(11)],  # 11 stocks
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
-            },
+            json={**_BODY, "stocks": [f"STOCK{i}" for i in range(11)]},  # 11 stocks
         )
 
         # Then
@@ -286,13 +390,7 @@ class TestValidationErrors:
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": ["TEST"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": -1000.0},  # Negative
-            },
+            json={**_BODY, "investment": {"amount": -1000.0}},  # Negative
         )
 
         # Then
@@ -303,13 +401,7 @@ class TestValidationErrors:
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": ["TEST"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 0},  # Zero
-            },
+            json={**_BODY, "investment": {"amount": 0}},  # Zero
         )
 
         # Then
@@ -320,13 +412,7 @@ class TestValidationErrors:
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": ["TEST"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "invalid_strategy",  # Invalid
-                "investment": {"amount": 10000.0},
-            },
+            json={**_BODY, "strategy": "invalid_strategy"},  # Invalid
         )
 
         # Then
@@ -337,13 +423,7 @@ class TestValidationErrors:
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": [""],  # Empty string
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
-            },
+            json={**_BODY, "stocks": [""]},  # Empty string
         )
 
         # Then
@@ -372,68 +452,28 @@ class TestValidationErrors:
 class TestBusinessErrors:
     """Tests for business logic errors"""
 
-    def test_stock_not_found(self, client, mock_service):
-        """Should return 404 when stock data not found"""
-        # Given
-        mock_service.run_multiple_backtests.side_effect = StockDataError("Stock not found")
-
-        # When
-        response = client.post(
-            "/api/backtest",
-            json={
-                "stocks": ["INVALID"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
-            },
-        )
-
-        # Then
-        assert response.status_code == 404
-        assert "Stock not found" in response.text
-
-    def test_value_error_returns_400(self, client, mock_service):
-        """Should return 400 for ValueError"""
-        # Given
-        mock_service.run_multiple_backtests.side_effect = ValueError("Invalid parameters")
-
-        # When
-        response = client.post(
-            "/api/backtest",
-            json={
-                "stocks": ["TEST"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
-            },
-        )
-
-        # Then
-        assert response.status_code == 400
-        assert "Invalid parameters" in response.text
-
-    def test_unexpected_error_returns_500(self, client, mock_service):
-        """Should return 500 for unexpected errors"""
+    @pytest.mark.parametrize(
+        ("error", "status_code", "message"),
+        [
+            (StockDataError("Stock not found"), 404, "Stock not found"),
+            (ValueError("Invalid parameters"), 400, "Invalid parameters"),
+            (Exception("Unexpected error"), 500, "Internal server error"),
+        ],
+    )
+    def test_error_mapping(self, client, mock_service, error, status_code, message):
+        """Should map service errors to 404 (no data), 400 (invalid) and 500 (unexpected)"""
         # Given
-        mock_service.run_multiple_backtests.side_effect = Exception("Unexpected error")
+        mock_service.run_multiple_backtests_async.side_effect = error
 
         # When
         response = client.post(
             "/api/backtest",
-            json={
-                "stocks": ["TEST"],
-                "start_date": "2024-01-01",
-                "end_date": "2024-12-31",
-                "strategy": "lump_sum",
-                "investment": {"amount": 10000.0},
-            },
+            json=_BODY,
         )
 
         # Then
-        assert response.status_code == 500
-        assert "Internal server error" in response.text
+        assert response.status_code == status_code
+        assert message in response.text
 
 
 # ============================================================================
@@ -476,3 +516,21 @@ class TestRootEndpoint:
         assert data["status"] == "running"
         assert "docs" in data
         assert "health" in data
+
+
+# ============================================================================
+# Tests: Application Lifespan
+# ============================================================================
+
+
+class TestLifespan:
+    """Tests for shared dependencies created at startup"""
+
+    def test_startup_creates_shared_service(self, client):
+        """Should build one adapter and service for the whole app"""
+        # When: The client has run the app startup
+        adapter = app.state.yfinance_adapter
+        service = app.state.backtest_service
+
+        # Then
+        assert service.data_adapter is adapter
@@ -5,14 +5,15 @@ Tests the service layer that coordinates domain and infrastructure.
 Uses mocks to avoid real API calls.
 """
 
-from datetime import datetime
-from unittest.mock import Mock
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, create_autospec
 
 import pytest
 
 from application.backtest_service import BacktestService
 from domain.models import BacktestResult, StockPrice
-from infrastructure.yfinance_adapter import StockDataError
+from infrastructure.yfinance_adapter import StockDataError, YFinanceAdapter
 
 # ============================================================================
 # Fixtures
@@ -21,8 +22,8 @@ from infrastructure.yfinance_adapter import StockDataError
 
 @pytest.fixture
 def mock_adapter():
-    """Mock YFinanceAdapter"""
-    return Mock()
+    """Mock YFinanceAdapter (autospec, so calls must match the real signatures)"""
+    return create_autospec(YFinanceAdapter, instance=True)
 
 
 @pytest.fixture
@@ -32,9 +33,21 @@ def service(mock_adapter):
 
 
 @pytest.fixture
-def sample_prices():
-    """Sample price data for testing"""
-    return [StockPrice(date=datetime(2024, 1, i), close=100.0 + i) for i in range(1, 31)]
+def sample_prices(sample_prices_252):
+    """Sample price data for testing (shared, see conftest)"""
+    return sample_prices_252
+
+
+def fetch_by_symbol(data):
+    """get_stock_data side effect returning (or raising) data[symbol], whatever the call order"""
+
+    def fetch(symbol, start_date, end_date):
+        outcome = data[symbol]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return fetch
 
 
 @pytest.fixture
@@ -70,7 +83,7 @@ class TestRunBacktest:
         )
 
         # Then
-        assert isinstance(result, BacktestResult)
+        assert type(result) is BacktestResult
         assert result.symbol == "TEST"
         assert result.name == "Test Stock"
         assert result.strategy == "lump_sum"
@@ -93,7 +106,7 @@ class TestRunBacktest:
         )
 
         # Then
-        assert isinstance(result, BacktestResult)
+        assert type(result) is BacktestResult
         assert result.strategy == "dca"
         assert result.total_invested >= 1000.0  # At least one month invested
 
@@ -150,28 +163,45 @@ class TestRunBacktest:
 
 
 # ============================================================================
-# Tests: run_multiple_backtests()
+# Tests: run_multiple_backtests_async()
 # ============================================================================
 
 
+def run_multiple(service, **kwargs):
+    """Run the multi-symbol backtest through the async path the route uses"""
+    return asyncio.run(service.run_multiple_backtests_async(**kwargs))
+
+
 class TestRunMultipleBacktests:
-    """Tests for run_multiple_backtests() method"""
+    """Tests for run_multiple_backtests_async() (and its blocking wrapper)"""
+
+    @pytest.fixture(autouse=True)
+    def async_fetch(self, mock_adapter):
+        """Route the adapter's async fetch through the sync get_stock_data mock"""
+        mock_adapter.get_stock_data_async = AsyncMock(
+            side_effect=lambda symbol, start, end, executor=None: mock_adapter.get_stock_data(
+                symbol, start, end
+            )
+        )
 
     def test_success_with_multiple_symbols(
         self, service, mock_adapter, sample_prices, start_date, end_date
     ):
         """Should successfully run backtests for multiple symbols"""
-        # Given
-        mock_adapter.get_stock_data.side_effect = [
-            (sample_prices, "Stock A"),
-            (
-                [StockPrice(date=datetime(2024, 1, i), close=200.0 + i) for i in range(1, 31)],
-                "Stock B",
-            ),
-        ]
+        # Given: Fetches run concurrently, so map data by symbol instead of call order
+        mock_adapter.get_stock_data.side_effect = fetch_by_symbol(
+            {
+                "AAPL": (sample_prices, "Stock A"),
+                "GOOGL": (
+                    [StockPrice(date=datetime(2024, 1, i), close=200.0 + i) for i in range(1, 31)],
+                    "Stock B",
+                ),
+            }
+        )
 
         # When
-        results, comparison = service.run_multiple_backtests(
+        results, comparison = run_multiple(
+            service,
             symbols=["AAPL", "GOOGL"],
             start_date=start_date,
             end_date=end_date,
@@ -194,14 +224,20 @@ class TestRunMultipleBacktests:
     ):
         """Should continue with other symbols when one fails"""
         # Given
-        mock_adapter.get_stock_data.side_effect = [
-            (sample_prices, "Stock A"),
-            StockDataError("Stock not found"),  # Second symbol fails
-            ([StockPrice(date=datetime(2024, 1, i), close=300.0) for i in range(1, 31)], "Stock C"),
-        ]
+        mock_adapter.get_stock_data.side_effect = fetch_by_symbol(
+            {
+                "AAPL": (sample_prices, "Stock A"),
+                "INVALID": StockDataError("Stock not found"),  # Second symbol fails
+                "MSFT": (
+                    [StockPrice(date=datetime(2024, 1, i), close=300.0) for i in range(1, 31)],
+                    "Stock C",
+                ),
+            }
+        )
 
         # When
-        results, comparison = service.run_multiple_backtests(
+        results, comparison = run_multiple(
+            service,
             symbols=["AAPL", "INVALID", "MSFT"],
             start_date=start_date,
             end_date=end_date,
@@ -218,14 +254,17 @@ class TestRunMultipleBacktests:
     def test_raises_when_all_symbols_fail(self, service, mock_adapter, start_date, end_date):
         """Should raise ValueError when all symbols fail"""
         # Given
-        mock_adapter.get_stock_data.side_effect = [
-            StockDataError("Stock 1 not found"),
-            StockDataError("Stock 2 not found"),
-        ]
+        mock_adapter.get_stock_data.side_effect = fetch_by_symbol(
+            {
+                "INVALID1": StockDataError("Stock 1 not found"),
+                "INVALID2": StockDataError("Stock 2 not found"),
+            }
+        )
 
         # When/Then
         with pytest.raises(ValueError, match="All symbols failed"):
-            service.run_multiple_backtests(
+            run_multiple(
+                service,
                 symbols=["INVALID1", "INVALID2"],
                 start_date=start_date,
                 end_date=end_date,
@@ -237,7 +276,8 @@ class TestRunMultipleBacktests:
         """Should raise ValueError when no symbols provided"""
         # When/Then
         with pytest.raises(ValueError, match="At least one symbol is required"):
-            service.run_multiple_backtests(
+            run_multiple(
+                service,
                 symbols=[],
                 start_date=start_date,
                 end_date=end_date,
@@ -250,14 +290,20 @@ class TestRunMultipleBacktests:
     ):
         """Should handle unexpected errors and continue with other symbols"""
         # Given
-        mock_adapter.get_stock_data.side_effect = [
-            (sample_prices, "Stock A"),
-            Exception("Unexpected error"),  # Unexpected failure
-            ([StockPrice(date=datetime(2024, 1, i), close=300.0) for i in range(1, 31)], "Stock C"),
-        ]
+        mock_adapter.get_stock_data.side_effect = fetch_by_symbol(
+            {
+                "AAPL": (sample_prices, "Stock A"),
+                "PROBLEM": Exception("Unexpected error"),  # Unexpected failure
+                "MSFT": (
+                    [StockPrice(date=datetime(2024, 1, i), close=300.0) for i in range(1, 31)],
+                    "Stock C",
+                ),
+            }
+        )
 
         # When
-        results, comparison = service.run_multiple_backtests(
+        results, comparison = run_multiple(
+            service,
             symbols=["AAPL", "PROBLEM", "MSFT"],
             start_date=start_date,
             end_date=end_date,
@@ -278,7 +324,8 @@ class TestRunMultipleBacktests:
         mock_adapter.get_stock_data.return_value = (sample_prices, "Test Stock")
 
         # When
-        results, comparison = service.run_multiple_backtests(
+        results, comparison = run_multiple(
+            service,
             symbols=["TEST"],
             start_date=start_date,
             end_date=end_date,
@@ -300,16 +347,14 @@ class TestRunMultipleBacktests:
         # Given
         # Create 90 days of data (3 months)
         prices = [
-            StockPrice(
-                date=datetime(2024, 1, 1) + __import__("datetime").timedelta(days=i),
-                close=100.0 + i,
-            )
+            StockPrice(date=datetime(2024, 1, 1) + timedelta(days=i), close=100.0 + i)
             for i in range(90)
         ]
         mock_adapter.get_stock_data.return_value = (prices, "Test Stock")
 
         # When
-        results, comparison = service.run_multiple_backtests(
+        results, comparison = run_multiple(
+            service,
             symbols=["TEST"],
             start_date=start_date,
             end_date=datetime(2024, 3, 31),
@@ -321,3 +366,45 @@ class TestRunMultipleBacktests:
         assert len(results) == 1
         assert results[0].strategy == "dca"
         assert results[0].total_invested >= 3000.0  # 3 months * 1000
+
+    def test_fetches_duplicate_symbols_once(
+        self, service, mock_adapter, sample_prices, start_date, end_date
+    ):
+        """Should fetch each distinct symbol once but return a result per entry"""
+        # Given
+        mock_adapter.get_stock_data.return_value = (sample_prices, "Test Stock")
+
+        # When
+        results, _ = run_multiple(
+            service,
+            symbols=["AAPL", "AAPL"],
+            start_date=start_date,
+            end_date=end_date,
+            strategy="lump_sum",
+            amount=10000.0,
+        )
+
+        # Then
+        assert [r.symbol for r in results] == ["AAPL", "AAPL"]
+        mock_adapter.get_stock_data.assert_called_once_with("AAPL", start_date, end_date)
+
+    def test_blocking_wrapper_delegates(
+        self, service, mock_adapter, sample_prices, start_date, end_date
+    ):
+        """Should give the same results through the blocking wrapper"""
+        # Given
+        mock_adapter.get_stock_data.return_value = (sample_prices, "Test Stock")
+
+        # When
+        results, comparison = service.run_multiple_backtests(
+            symbols=["TEST"],
+            start_date=start_date,
+            end_date=end_date,
+            strategy="lump_sum",
+            amount=10000.0,
+        )
+
+        # Then
+        assert [r.symbol for r in results] == ["TEST"]
+        assert comparison.best_return == "TEST"
+        mock_adapter.get_stock_data_async.assert_awaited_once()
@@ -0,0 +1,45 @@
+"""
+Shared pytest fixtures
+
+Unit tests must not touch the network: any real HTTP request made through
+requests fails loudly. Tests marked integration are left alone.
+"""
+
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from domain.calculations import FloatArray
+from domain.models import StockPrice
+
+
+@pytest.fixture(autouse=True)
+def _no_network(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Fail unit tests that reach the network (e.g. a code path skipping a mock)"""
+    if request.node.get_closest_marker("integration"):
+        yield
+        return
+
+    with patch(
+        "requests.Session.request",
+        side_effect=RuntimeError("network access in a unit test"),
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
+def sample_closes_252() -> FloatArray:
+    """One year of steadily rising closes: $100 → $150 over 252 days"""
+    closes = 100.0 + 0.2 * np.arange(252, dtype=np.float64)
+    closes.flags.writeable = False
+    return closes
+
+
+@pytest.fixture(scope="session")
+def sample_prices_252(sample_closes_252: FloatArray) -> list[StockPrice]:
+    """sample_closes_252 as daily prices from 2024-01-01"""
+    start = np.datetime64("2024-01-01")
+    dates = np.arange(start, start + len(sample_closes_252)).astype("datetime64[us]")
+    return list(map(StockPrice, dates.tolist(), sample_closes_252.tolist()))
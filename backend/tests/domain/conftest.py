@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the domain tests
+
+Daily return series are built once per session as read-only NumPy arrays.
+"""
+
+import numpy as np
+import pytest
+
+from domain.calculations import FloatArray
+
+
+def _frozen(values: FloatArray) -> FloatArray:
+    values.flags.writeable = False
+    return values
+
+
+@pytest.fixture(scope="session")
+def sharpe_returns_252() -> FloatArray:
+    """One year of small positive returns: 0.1% ± 0.01% in a 3-day cycle"""
+    return _frozen(0.001 + (np.arange(252, dtype=np.float64) % 3 - 1) * 1e-4)
+
+
+@pytest.fixture(scope="session")
+def constant_returns_252() -> FloatArray:
+    """One year of a constant 1% daily return (zero volatility)"""
+    return _frozen(np.full(252, 0.01))
+
+
+@pytest.fixture(scope="session")
+def alternating_returns_252() -> FloatArray:
+    """One year of returns alternating between +1% and -1%"""
+    return _frozen(np.tile([0.01, -0.01], 126))
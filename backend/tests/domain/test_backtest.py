@@ -5,41 +5,54 @@ Testing backtest logic with TDD approach.
 Goal: 100% coverage for domain layer.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
+import numpy.typing as npt
 import pytest
 
 from domain.backtest import backtest_dca, backtest_lump_sum
-from domain.models import StockPrice
+from domain.models import PriceSeries, StockPrice
+
+
+def daily_prices(closes: npt.ArrayLike) -> list[StockPrice]:
+    """One price per calendar day from 2024-01-01 (dates built as a datetime64 range)"""
+    close_array = np.asarray(closes, dtype=np.float64)
+    start = np.datetime64("2024-01-01")
+    dates = np.arange(start, start + len(close_array)).astype("datetime64[us]")
+    return list(map(StockPrice, dates.tolist(), close_array.tolist()))
+
+
+@pytest.fixture(scope="module")
+def simple_prices(sample_prices_252: list[StockPrice]) -> list[StockPrice]:
+    """Simple price data: $100 → $150 over 1 year (252 trading days)"""
+    return sample_prices_252
+
+
+@pytest.fixture(scope="module")
+def volatile_prices() -> list[StockPrice]:
+    """Volatile price data with drawdowns"""
+    # Pattern: up 1% for 5 days, down 1% for 5 days
+    return daily_prices(100.0 * np.cumprod(np.where(np.arange(252) % 10 < 5, 1.01, 0.99)))
+
+
+@pytest.fixture(scope="module")
+def monthly_prices() -> list[StockPrice]:
+    """Price data covering multiple months"""
+    # 12 months of daily data
+    return daily_prices(100.0 + np.arange(252) * 0.1)
+
+
+@pytest.fixture(scope="module")
+def volatile_monthly_prices() -> list[StockPrice]:
+    """Volatile price data for testing DCA advantages"""
+    # Simulate volatility: up 0.5% for 15 days, down 0.5% for 15 days
+    return daily_prices(100.0 * np.cumprod(np.where(np.arange(252) % 30 < 15, 1.005, 0.995)))
 
 
 class TestBacktestLumpSum:
     """Test lump sum investment backtest"""
 
-    @pytest.fixture
-    def simple_prices(self) -> list[StockPrice]:
-        """Simple price data: $100 → $150 over 1 year"""
-        base_date = datetime(2024, 1, 1)
-        return [
-            StockPrice(date=base_date + timedelta(days=i), close=100.0 + i * 0.2)
-            for i in range(252)  # 252 trading days
-        ]
-
-    @pytest.fixture
-    def volatile_prices(self) -> list[StockPrice]:
-        """Volatile price data with drawdowns"""
-        base_date = datetime(2024, 1, 1)
-        # Pattern: up, down, up, down
-        prices = []
-        price = 100.0
-        for i in range(252):
-            if i % 10 < 5:
-                price *= 1.01  # Up 1%
-            else:
-                price *= 0.99  # Down 1%
-            prices.append(StockPrice(date=base_date + timedelta(days=i), close=price))
-        return prices
-
     def test_basic_lump_sum_positive_return(self, simple_prices: list[StockPrice]) -> None:
         # Given
         initial_amount = 100000.0
@@ -74,7 +87,7 @@ class TestBacktestLumpSum:
 
         # Then
         expected_shares = initial_amount / first_price
-        assert abs(result.history[0].shares - expected_shares) < 0.01
+        assert result.history[0].shares == pytest.approx(expected_shares, abs=0.01)
 
     def test_portfolio_value_changes_with_price(self, simple_prices: list[StockPrice]) -> None:
         # Given
@@ -101,7 +114,7 @@ class TestBacktestLumpSum:
 
         # Then: Shares should never change (buy and hold)
         shares = [snapshot.shares for snapshot in result.history]
-        assert all(abs(s - shares[0]) < 0.01 for s in shares)
+        assert shares == pytest.approx([shares[0]] * len(shares), abs=0.01)
 
     def test_max_drawdown_with_volatile_prices(self, volatile_prices: list[StockPrice]) -> None:
         # Given
@@ -127,6 +140,34 @@ class TestBacktestLumpSum:
         # Then: Volatility should be positive
         assert result.volatility >= 0
 
+    def test_history_behaves_like_list(self, simple_prices: list[StockPrice]) -> None:
+        # When
+        result = backtest_lump_sum(prices=simple_prices, initial_amount=100000.0)
+
+        # Then: Indexing, slicing and iteration agree
+        snapshots = list(result.history)
+        assert result.history[0] == snapshots[0]
+        assert result.history[-1] == snapshots[-1]
+        assert result.history[10:13] == snapshots[10:13]
+        assert snapshots[0].date == simple_prices[0].date
+
+    def test_price_series_matches_list(self, simple_prices: list[StockPrice]) -> None:
+        # Given: The same prices as a columnar series (as returned by the adapter)
+        series = PriceSeries(
+            np.array([p.date for p in simple_prices], dtype="datetime64[us]"),
+            np.array([p.close for p in simple_prices]),
+        )
+
+        # When
+        from_list = backtest_lump_sum(prices=simple_prices, initial_amount=100000.0)
+        from_series = backtest_lump_sum(prices=series, initial_amount=100000.0)
+
+        # Then
+        assert list(series) == simple_prices
+        assert from_series.final_value == from_list.final_value
+        assert from_series.sharpe_ratio == from_list.sharpe_ratio
+        assert list(from_series.history) == list(from_list.history)
+
     def test_raises_on_empty_prices(self) -> None:
         # Given
         prices: list[StockPrice] = []
@@ -135,18 +176,10 @@ class TestBacktestLumpSum:
         with pytest.raises(ValueError, match="Prices list cannot be empty"):
             backtest_lump_sum(prices=prices, initial_amount=100000.0, symbol="TEST")
 
-    def test_raises_on_zero_amount(self, simple_prices: list[StockPrice]) -> None:
-        # Given
-        initial_amount = 0.0
-
-        # When/Then
-        with pytest.raises(ValueError, match="Initial amount must be positive"):
-            backtest_lump_sum(prices=simple_prices, initial_amount=initial_amount, symbol="TEST")
-
-    def test_raises_on_negative_amount(self, simple_prices: list[StockPrice]) -> None:
-        # Given
-        initial_amount = -100000.0
-
+    @pytest.mark.parametrize("initial_amount", [0.0, -100000.0])
+    def test_raises_on_non_positive_amount(
+        self, simple_prices: list[StockPrice], initial_amount: float
+    ) -> None:
         # When/Then
         with pytest.raises(ValueError, match="Initial amount must be positive"):
             backtest_lump_sum(prices=simple_prices, initial_amount=initial_amount, symbol="TEST")
@@ -166,31 +199,6 @@ class TestBacktestLumpSum:
 class TestBacktestDCA:
     """Test dollar-cost averaging (DCA) backtest"""
 
-    @pytest.fixture
-    def monthly_prices(self) -> list[StockPrice]:
-        """Price data covering multiple months"""
-        base_date = datetime(2024, 1, 1)
-        # 12 months of daily data
-        return [
-            StockPrice(date=base_date + timedelta(days=i), close=100.0 + i * 0.1)
-            for i in range(252)
-        ]
-
-    @pytest.fixture
-    def volatile_monthly_prices(self) -> list[StockPrice]:
-        """Volatile price data for testing DCA advantages"""
-        base_date = datetime(2024, 1, 1)
-        prices = []
-        price = 100.0
-        for i in range(252):
-            # Simulate volatility
-            if i % 30 < 15:
-                price *= 1.005  # Up 0.5%
-            else:
-                price *= 0.995  # Down 0.5%
-            prices.append(StockPrice(date=base_date + timedelta(days=i), close=price))
-        return prices
-
     def test_basic_dca_positive_return(self, monthly_prices: list[StockPrice]) -> None:
         # Given
         monthly_amount = 10000.0
@@ -302,18 +310,10 @@ class TestBacktestDCA:
         with pytest.raises(ValueError, match="Prices list cannot be empty"):
             backtest_dca(prices=prices, monthly_amount=10000.0, symbol="TEST")
 
-    def test_raises_on_zero_amount(self, monthly_prices: list[StockPrice]) -> None:
-        # Given
-        monthly_amount = 0.0
-
-        # When/Then
-        with pytest.raises(ValueError, match="Monthly amount must be positive"):
-            backtest_dca(prices=monthly_prices, monthly_amount=monthly_amount, symbol="TEST")
-
-    def test_raises_on_negative_amount(self, monthly_prices: list[StockPrice]) -> None:
-        # Given
-        monthly_amount = -10000.0
-
+    @pytest.mark.parametrize("monthly_amount", [0.0, -10000.0])
+    def test_raises_on_non_positive_amount(
+        self, monthly_prices: list[StockPrice], monthly_amount: float
+    ) -> None:
         # When/Then
         with pytest.raises(ValueError, match="Monthly amount must be positive"):
             backtest_dca(prices=monthly_prices, monthly_amount=monthly_amount, symbol="TEST")
@@ -339,3 +339,16 @@ class TestBacktestDCA:
 
         # Then: Should invest only once
         assert result.total_invested == 10000.0
+
+    def test_month_boundaries_use_local_dates(self) -> None:
+        # Given: Timezone-aware prices at local midnight (UTC+8), Jan 30 - Feb 2
+        tz = timezone(timedelta(hours=8))
+        base_date = datetime(2024, 1, 30, tzinfo=tz)
+        prices = [StockPrice(date=base_date + timedelta(days=i), close=100.0) for i in range(4)]
+
+        # When
+        result = backtest_dca(prices=prices, monthly_amount=10000.0, symbol="TEST")
+
+        # Then: Invests on Jan 30 and on Feb 1 (local date), not on Jan 31 (UTC date)
+        cumulative = [snapshot.cumulative_invested for snapshot in result.history]
+        assert cumulative == [10000.0, 10000.0, 20000.0, 20000.0]
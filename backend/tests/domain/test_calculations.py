@@ -5,14 +5,20 @@ Following TDD: Write tests first, then implementation.
 Goal: 100% coverage for domain layer.
 """
 
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime
+from itertools import pairwise
 
+import numpy as np
 import pytest
 
 from domain.calculations import (
+    FloatArray,
     calculate_cagr,
     calculate_comparison,
     calculate_max_drawdown,
+    calculate_risk_metrics,
     calculate_sharpe_ratio,
     calculate_volatility,
 )
@@ -22,174 +28,100 @@ from domain.models import BacktestResult, PortfolioSnapshot
 class TestCalculateCAGR:
     """Test CAGR (Compound Annual Growth Rate) calculation"""
 
-    def test_positive_return_over_3_years(self) -> None:
-        # Given
-        initial = 100000.0
-        final = 150000.0
-        years = 3.0
-
+    @pytest.mark.parametrize(
+        ("initial", "final", "years", "expected", "tolerance"),
+        [
+            # (150000/100000)^(1/3) - 1 = 14.47%
+            pytest.param(100000.0, 150000.0, 3.0, 0.1447, 0.001, id="3yr_gain"),
+            # Lost 50% over 2 years
+            pytest.param(100000.0, 50000.0, 2.0, -0.2929, 0.001, id="2yr_loss"),
+            pytest.param(100000.0, 100000.0, 5.0, 0.0, 1e-10, id="no_change"),
+            # Exactly -100%
+            pytest.param(100000.0, 0.0, 1.0, -1.0, 0.0, id="complete_loss"),
+        ],
+    )
+    def test_cagr_values(
+        self, initial: float, final: float, years: float, expected: float, tolerance: float
+    ) -> None:
         # When
         result = calculate_cagr(initial, final, years)
 
         # Then
-        # (150000/100000)^(1/3) - 1 = 0.1447 (14.47%)
-        assert abs(result - 0.1447) < 0.001
-
-    def test_negative_return(self) -> None:
-        # Given: Lost 50% over 2 years
-        initial = 100000.0
-        final = 50000.0
-        years = 2.0
-
-        # When
-        result = calculate_cagr(initial, final, years)
-
-        # Then: Negative CAGR
-        assert result < 0
-        assert abs(result - (-0.2929)) < 0.001
-
-    def test_no_return(self) -> None:
-        # Given: No change
-        initial = 100000.0
-        final = 100000.0
-        years = 5.0
-
-        # When
-        result = calculate_cagr(initial, final, years)
-
-        # Then
-        assert abs(result) < 1e-10  # Close to zero
-
-    def test_complete_loss(self) -> None:
-        # Given: Lost everything
-        initial = 100000.0
-        final = 0.0
-        years = 1.0
-
-        # When
-        result = calculate_cagr(initial, final, years)
-
-        # Then: -100% return
-        assert result == -1.0
-
-    def test_raises_on_zero_initial(self) -> None:
-        # Given
-        initial = 0.0
-        final = 100000.0
-        years = 1.0
-
-        # When/Then
-        with pytest.raises(ValueError, match="Initial value must be positive"):
-            calculate_cagr(initial, final, years)
-
-    def test_raises_on_negative_initial(self) -> None:
-        # Given
-        initial = -100000.0
-        final = 150000.0
-        years = 1.0
-
-        # When/Then
-        with pytest.raises(ValueError, match="Initial value must be positive"):
-            calculate_cagr(initial, final, years)
-
-    def test_raises_on_zero_years(self) -> None:
-        # Given
-        initial = 100000.0
-        final = 150000.0
-        years = 0.0
-
-        # When/Then
-        with pytest.raises(ValueError, match="Years must be positive"):
-            calculate_cagr(initial, final, years)
+        assert result == pytest.approx(expected, abs=tolerance)
 
-    def test_raises_on_negative_years(self) -> None:
-        # Given
-        initial = 100000.0
-        final = 150000.0
-        years = -1.0
 
-        # When/Then
-        with pytest.raises(ValueError, match="Years must be positive"):
-            calculate_cagr(initial, final, years)
+def _reference_max_drawdown(values: list[float]) -> float:
+    """Single-pass loop oracle for calculate_max_drawdown"""
+    peak = values[0]
+    max_drawdown = 0.0
+    for value in values[1:]:
+        peak = max(peak, value)
+        max_drawdown = min(max_drawdown, (value - peak) / peak)
+    return max_drawdown
 
 
 class TestCalculateMaxDrawdown:
     """Test Maximum Drawdown calculation"""
 
-    def test_no_drawdown(self) -> None:
-        # Given: Always increasing
-        values = [100.0, 110.0, 120.0, 130.0]
-
+    @pytest.mark.parametrize(
+        ("values", "expected", "tolerance"),
+        [
+            pytest.param([100.0, 110.0, 120.0, 130.0], 0.0, 1e-10, id="always_increasing"),
+            # Peak 120, trough 80
+            pytest.param([100.0, 120.0, 80.0, 100.0], (80.0 - 120.0) / 120.0, 0.0001, id="simple"),
+            # Two drawdowns, the second (150 -> 90) larger
+            pytest.param(
+                [100.0, 120.0, 100.0, 150.0, 90.0], (90.0 - 150.0) / 150.0, 0.0001, id="multiple"
+            ),
+            pytest.param(
+                [100.0, 80.0, 60.0, 40.0], (40.0 - 100.0) / 100.0, 0.0001, id="continuous"
+            ),
+            # No drawdown possible
+            pytest.param([100.0], 0.0, 1e-10, id="single_value"),
+        ],
+    )
+    def test_max_drawdown_values(
+        self, values: list[float], expected: float, tolerance: float
+    ) -> None:
         # When
         result = calculate_max_drawdown(values)
 
         # Then
-        assert abs(result) < 1e-10  # Close to zero
+        assert result == pytest.approx(expected, abs=tolerance)
 
-    def test_simple_drawdown(self) -> None:
-        # Given: Peak 120, trough 80
-        values = [100.0, 120.0, 80.0, 100.0]
+    def test_accepts_numpy_array(self) -> None:
+        # Given: Same series as the multiple-drawdowns case, as an ndarray
+        values = np.array([100.0, 120.0, 100.0, 150.0, 90.0])
 
         # When
         result = calculate_max_drawdown(values)
 
-        # Then: (80 - 120) / 120 = -33.33%
-        expected = (80.0 - 120.0) / 120.0
-        assert abs(result - expected) < 0.0001
-
-    def test_multiple_drawdowns(self) -> None:
-        # Given: Two drawdowns, second one larger
-        values = [100.0, 120.0, 100.0, 150.0, 90.0]
-
-        # When
-        result = calculate_max_drawdown(values)
-
-        # Then: (90 - 150) / 150 = -40%
+        # Then
         expected = (90.0 - 150.0) / 150.0
-        assert abs(result - expected) < 0.0001
-
-    def test_continuous_decline(self) -> None:
-        # Given: Continuous decline
-        values = [100.0, 80.0, 60.0, 40.0]
-
-        # When
-        result = calculate_max_drawdown(values)
-
-        # Then: (40 - 100) / 100 = -60%
-        expected = (40.0 - 100.0) / 100.0
-        assert abs(result - expected) < 0.0001
+        assert result == pytest.approx(expected, abs=0.0001)
 
-    def test_single_value(self) -> None:
-        # Given
-        values = [100.0]
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_reference_on_long_random_walks(self, seed: int) -> None:
+        # Given: 100k-day geometric random walk
+        rng = np.random.default_rng(seed)
+        values = 100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.02, size=100_000))
 
         # When
-        result = calculate_max_drawdown(values)
-
-        # Then: No drawdown possible
-        assert abs(result) < 1e-10  # Close to zero
-
-    def test_raises_on_empty_list(self) -> None:
-        # Given
-        values: list[float] = []
+        result = calculate_max_drawdown(values.tolist())
 
-        # When/Then
-        with pytest.raises(ValueError, match="Values list cannot be empty"):
-            calculate_max_drawdown(values)
+        # Then
+        assert result == pytest.approx(_reference_max_drawdown(values.tolist()), abs=1e-9)
 
 
 class TestCalculateVolatility:
     """Test annualized volatility calculation"""
 
-    def test_zero_volatility(self) -> None:
-        # Given: No variation
-        returns = [0.01] * 252  # 252 trading days, constant return
-
-        # When
-        result = calculate_volatility(returns)
+    def test_zero_volatility(self, constant_returns_252: FloatArray) -> None:
+        # When: 252 trading days, constant return
+        result = calculate_volatility(constant_returns_252)
 
         # Then: Zero volatility
-        assert abs(result) < 1e-10  # Close to zero
+        assert result == pytest.approx(0.0, abs=1e-10)
 
     def test_positive_volatility(self) -> None:
         # Given: Some variation
@@ -201,25 +133,26 @@ class TestCalculateVolatility:
         # Then: Positive volatility
         assert result > 0
 
-    def test_annualization_factor(self) -> None:
-        # Given: Daily returns
+    def test_annualization_factor(self, alternating_returns_252: FloatArray) -> None:
+        # Given: Daily returns that produce std of ~0.01
         daily_std = 0.01
-        # Returns that produce std of ~0.01
-        returns = [0.01, -0.01, 0.01, -0.01] * 63  # 252 days
 
         # When
-        result = calculate_volatility(returns)
+        result = calculate_volatility(alternating_returns_252)
 
         # Then: Should be annualized (multiplied by sqrt(252))
         assert result > daily_std  # Annualized should be larger
 
-    def test_raises_on_empty_list(self) -> None:
+    def test_accepts_numpy_array(self) -> None:
         # Given
-        returns: list[float] = []
+        returns = [0.01, -0.01, 0.02, -0.02, 0.01]
 
-        # When/Then
-        with pytest.raises(ValueError, match="Returns list cannot be empty"):
-            calculate_volatility(returns)
+        # When
+        result_list = calculate_volatility(returns)
+        result_array = calculate_volatility(np.array(returns))
+
+        # Then: Same answer for list and ndarray input
+        assert result_list == pytest.approx(result_array, abs=1e-12)
 
     def test_single_return(self) -> None:
         # Given
@@ -229,25 +162,22 @@ class TestCalculateVolatility:
         result = calculate_volatility(returns)
 
         # Then: Zero volatility (need at least 2 points for variance)
-        assert abs(result) < 1e-10  # Close to zero
+        assert result == pytest.approx(0.0, abs=1e-10)
 
 
 class TestCalculateSharpeRatio:
     """Test Sharpe Ratio calculation"""
 
-    def test_positive_sharpe(self) -> None:
-        # Given: Positive returns with some volatility
-        returns = [0.001 + (i % 3 - 1) * 0.0001 for i in range(252)]
-
-        # When
-        result = calculate_sharpe_ratio(returns, risk_free_rate=0.02)
+    def test_positive_sharpe(self, sharpe_returns_252: FloatArray) -> None:
+        # When: Positive returns with some volatility
+        result = calculate_sharpe_ratio(sharpe_returns_252, risk_free_rate=0.02)
 
         # Then: Positive Sharpe ratio (positive excess return)
         assert result > 0
 
-    def test_negative_sharpe(self) -> None:
+    def test_negative_sharpe(self, sharpe_returns_252: FloatArray) -> None:
         # Given: Negative returns with volatility
-        returns = [-0.001 + (i % 3 - 1) * 0.0001 for i in range(252)]
+        returns = sharpe_returns_252 - 0.002
 
         # When
         result = calculate_sharpe_ratio(returns, risk_free_rate=0.02)
@@ -255,34 +185,114 @@ class TestCalculateSharpeRatio:
         # Then: Negative Sharpe ratio
         assert result < 0
 
-    def test_zero_volatility(self) -> None:
-        # Given: Constant returns (zero volatility)
-        returns = [0.01] * 252
-
-        # When
-        result = calculate_sharpe_ratio(returns, risk_free_rate=0.02)
+    def test_zero_volatility(self, constant_returns_252: FloatArray) -> None:
+        # When: Constant returns (zero volatility)
+        result = calculate_sharpe_ratio(constant_returns_252, risk_free_rate=0.02)
 
         # Then: Should handle division by zero gracefully (returns 0)
-        assert abs(result) < 1e-10  # Close to zero
-
-    def test_with_different_risk_free_rate(self) -> None:
-        # Given: Returns with volatility
-        returns = [0.002 + (i % 5 - 2) * 0.0001 for i in range(252)]
+        assert result == pytest.approx(0.0, abs=1e-10)
 
-        # When
-        result_low_rf = calculate_sharpe_ratio(returns, risk_free_rate=0.0)
-        result_high_rf = calculate_sharpe_ratio(returns, risk_free_rate=0.5)
+    def test_with_different_risk_free_rate(self, sharpe_returns_252: FloatArray) -> None:
+        # When: Returns with volatility
+        result_low_rf = calculate_sharpe_ratio(sharpe_returns_252, risk_free_rate=0.0)
+        result_high_rf = calculate_sharpe_ratio(sharpe_returns_252, risk_free_rate=0.5)
 
         # Then: Higher risk-free rate should lower Sharpe ratio
         assert result_low_rf > result_high_rf
 
-    def test_raises_on_empty_list(self) -> None:
-        # Given
-        returns: list[float] = []
 
-        # When/Then
-        with pytest.raises(ValueError, match="Returns list cannot be empty"):
-            calculate_sharpe_ratio(returns)
+class TestCalculateRiskMetrics:
+    """Test fused max drawdown / volatility / Sharpe calculation"""
+
+    def test_matches_individual_metrics(self) -> None:
+        # Given: A value series with ups and downs
+        values = [100.0 + (i % 7 - 3) * 2.5 + i * 0.1 for i in range(300)]
+        returns = [(b - a) / a for a, b in pairwise(values)]
+
+        # When
+        max_dd, volatility, sharpe = calculate_risk_metrics(values)
+
+        # Then: Same answers as the separate functions
+        assert max_dd == pytest.approx(calculate_max_drawdown(values))
+        assert volatility == pytest.approx(calculate_volatility(returns))
+        assert sharpe == pytest.approx(calculate_sharpe_ratio(returns))
+
+    def test_single_value(self) -> None:
+        # Given / When
+        result = calculate_risk_metrics([100.0])
+
+        # Then: No drawdown, no volatility
+        assert result == (0.0, 0.0, 0.0)
+
+
+# Sample results for the comparison tests (frozen dataclasses, safe to share)
+_HISTORY = (
+    PortfolioSnapshot(
+        date=datetime(2024, 1, 1),
+        value=100000.0,
+        shares=100.0,
+        cumulative_invested=100000.0,
+    ),
+)
+_APPLE_RESULT = BacktestResult(
+    symbol="AAPL",
+    name="Apple Inc.",
+    strategy="lump_sum",
+    total_return=0.5,  # 50%
+    cagr=0.15,  # 15%
+    max_drawdown=-0.2,
+    volatility=0.25,
+    sharpe_ratio=1.5,
+    final_value=150000.0,
+    total_invested=100000.0,
+    history=_HISTORY,
+)
+_GOOGL_RESULT = BacktestResult(
+    symbol="GOOGL",
+    name="Alphabet Inc.",
+    strategy="lump_sum",
+    total_return=0.3,  # 30%
+    cagr=0.20,  # 20% - Best CAGR
+    max_drawdown=-0.15,
+    volatility=0.20,  # Lowest volatility
+    sharpe_ratio=2.0,  # Best Sharpe
+    final_value=130000.0,
+    total_invested=100000.0,
+    history=_HISTORY,
+)
+_MSFT_RESULT = BacktestResult(
+    symbol="MSFT",
+    name="Microsoft Corp.",
+    strategy="lump_sum",
+    total_return=0.6,  # 60% - Best return
+    cagr=0.18,
+    max_drawdown=-0.25,
+    volatility=0.30,
+    sharpe_ratio=1.8,
+    final_value=160000.0,
+    total_invested=100000.0,
+    history=_HISTORY,
+)
+
+
+def _columnar_comparison(results: list[BacktestResult]) -> tuple[str, str, str, str]:
+    """Reference comparison over a record array: best return, Sharpe, lowest risk, CAGR"""
+    batch = np.rec.fromrecords(
+        [(r.symbol, r.total_return, r.sharpe_ratio, r.volatility, r.cagr) for r in results],
+        dtype=[
+            ("symbol", "U8"),
+            ("total_return", "f8"),
+            ("sharpe_ratio", "f8"),
+            ("volatility", "f8"),
+            ("cagr", "f8"),
+        ],
+    )
+    return (
+        str(batch.symbol[batch.total_return.argmax()]),
+        str(batch.symbol[batch.sharpe_ratio.argmax()]),
+        str(batch.symbol[batch.volatility.argmin()]),
+        str(batch.symbol[batch.cagr.argmax()]),
+    )
 
 
 class TestCalculateComparison:
@@ -290,58 +300,8 @@ class TestCalculateComparison:
 
     @pytest.fixture
     def sample_results(self) -> list[BacktestResult]:
-        """Create sample backtest results for testing"""
-        base_date = datetime(2024, 1, 1)
-        history = [
-            PortfolioSnapshot(
-                date=base_date,
-                value=100000.0,
-                shares=100.0,
-                cumulative_invested=100000.0,
-            )
-        ]
-
-        return [
-            BacktestResult(
-                symbol="AAPL",
-                name="Apple Inc.",
-                strategy="lump_sum",
-                total_return=0.5,  # 50%
-                cagr=0.15,  # 15%
-                max_drawdown=-0.2,
-                volatility=0.25,
-                sharpe_ratio=1.5,
-                final_value=150000.0,
-                total_invested=100000.0,
-                history=history,
-            ),
-            BacktestResult(
-                symbol="GOOGL",
-                name="Alphabet Inc.",
-                strategy="lump_sum",
-                total_return=0.3,  # 30%
-                cagr=0.20,  # 20% - Best CAGR
-                max_drawdown=-0.15,
-                volatility=0.20,  # Lowest volatility
-                sharpe_ratio=2.0,  # Best Sharpe
-                final_value=130000.0,
-                total_invested=100000.0,
-                history=history,
-            ),
-            BacktestResult(
-                symbol="MSFT",
-                name="Microsoft Corp.",
-                strategy="lump_sum",
-                total_return=0.6,  # 60% - Best return
-                cagr=0.18,
-                max_drawdown=-0.25,
-                volatility=0.30,
-                sharpe_ratio=1.8,
-                final_value=160000.0,
-                total_invested=100000.0,
-                history=history,
-            ),
-        ]
+        """Sample backtest results for testing"""
+        return [_APPLE_RESULT, _GOOGL_RESULT, _MSFT_RESULT]
 
     def test_finds_best_return(self, sample_results: list[BacktestResult]) -> None:
         # When
@@ -371,33 +331,48 @@ class TestCalculateComparison:
         # Then: GOOGL has best CAGR (20%)
         assert result.best_cagr == "GOOGL"
 
-    def test_single_result(self) -> None:
-        # Given
-        base_date = datetime(2024, 1, 1)
-        history = [
-            PortfolioSnapshot(
-                date=base_date,
-                value=100000.0,
-                shares=100.0,
-                cumulative_invested=100000.0,
-            )
-        ]
-        single_result = [
-            BacktestResult(
-                symbol="AAPL",
-                name="Apple Inc.",
-                strategy="lump_sum",
-                total_return=0.5,
-                cagr=0.15,
-                max_drawdown=-0.2,
-                volatility=0.25,
-                sharpe_ratio=1.5,
-                final_value=150000.0,
-                total_invested=100000.0,
-                history=history,
+    def test_performers_and_totals(self, sample_results: list[BacktestResult]) -> None:
+        # When
+        result = calculate_comparison(sample_results)
+
+        # Then: MSFT best (60%), GOOGL worst (30%), average of 50/30/60
+        assert result.best_performer.symbol == "MSFT"
+        assert result.worst_performer.symbol == "GOOGL"
+        assert result.worst_performer.total_return == 0.3
+        assert result.average_return == pytest.approx(1.4 / 3)
+        assert result.total_invested == 300000.0
+
+    def test_matches_columnar_reference(self, sample_results: list[BacktestResult]) -> None:
+        # Given: The samples plus 200 random results, rounded so that ties occur
+        rng = np.random.default_rng(0)
+        metrics = rng.normal(0.1, 0.2, size=(200, 4)).round(2)
+        results = sample_results + [
+            replace(
+                _APPLE_RESULT,
+                symbol=f"S{i}",
+                total_return=total_return,
+                sharpe_ratio=sharpe_ratio,
+                volatility=abs(volatility),
+                cagr=cagr,
             )
+            for i, (total_return, sharpe_ratio, volatility, cagr) in enumerate(metrics.tolist())
         ]
 
+        # When
+        result = calculate_comparison(results)
+
+        # Then: Same winners, including first-wins on ties
+        assert (
+            result.best_return,
+            result.best_sharpe,
+            result.lowest_risk,
+            result.best_cagr,
+        ) == _columnar_comparison(results)
+
+    def test_single_result(self) -> None:
+        # Given
+        single_result = [_APPLE_RESULT]
+
         # When
         result = calculate_comparison(single_result)
 
@@ -407,10 +382,57 @@ class TestCalculateComparison:
         assert result.lowest_risk == "AAPL"
         assert result.best_cagr == "AAPL"
 
-    def test_raises_on_empty_list(self) -> None:
-        # Given
-        results: list[BacktestResult] = []
 
+class TestInputValidation:
+    """Test the ValueError raised by every calculation for invalid input"""
+
+    @pytest.mark.parametrize(
+        ("func", "args", "match"),
+        [
+            pytest.param(
+                calculate_cagr,
+                (0.0, 100000.0, 1.0),
+                "Initial value must be positive",
+                id="cagr_zero_initial",
+            ),
+            pytest.param(
+                calculate_cagr,
+                (-100000.0, 150000.0, 1.0),
+                "Initial value must be positive",
+                id="cagr_negative_initial",
+            ),
+            pytest.param(
+                calculate_cagr,
+                (100000.0, 150000.0, 0.0),
+                "Years must be positive",
+                id="cagr_zero_years",
+            ),
+            pytest.param(
+                calculate_cagr,
+                (100000.0, 150000.0, -1.0),
+                "Years must be positive",
+                id="cagr_negative_years",
+            ),
+            pytest.param(
+                calculate_max_drawdown, ([],), "Values list cannot be empty", id="max_drawdown"
+            ),
+            pytest.param(
+                calculate_volatility, ([],), "Returns list cannot be empty", id="volatility"
+            ),
+            pytest.param(
+                calculate_sharpe_ratio, ([],), "Returns list cannot be empty", id="sharpe"
+            ),
+            pytest.param(
+                calculate_risk_metrics, ([],), "Values list cannot be empty", id="risk_metrics"
+            ),
+            pytest.param(
+                calculate_comparison, ([],), "Results list cannot be empty", id="comparison"
+            ),
+        ],
+    )
+    def test_raises(
+        self, func: Callable[..., object], args: tuple[object, ...], match: str
+    ) -> None:
         # When/Then
-        with pytest.raises(ValueError, match="Results list cannot be empty"):
-            calculate_comparison(results)
+        with pytest.raises(ValueError, match=match):
+            func(*args)
@@ -0,0 +1,99 @@
+"""
+Tests for domain/models.py
+
+Covers the columnar containers (PriceSeries, PortfolioHistory).
+"""
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from domain.models import PortfolioHistory, PriceSeries
+
+
+@pytest.fixture
+def dates() -> npt.NDArray[np.datetime64]:
+    """Three consecutive days from 2024-01-01 as datetime64[us]"""
+    start = np.datetime64("2024-01-01")
+    return np.arange(start, start + 3).astype("datetime64[us]")
+
+
+@pytest.fixture
+def closes() -> npt.NDArray[np.float64]:
+    """Three positive closing prices"""
+    return np.array([100.0, 101.0, 102.0])
+
+
+class TestColumnViews:
+    """Test how the containers store the caller's columns"""
+
+    def test_columns_are_frozen_without_freezing_caller_arrays(
+        self, dates: npt.NDArray[np.datetime64], closes: npt.NDArray[np.float64]
+    ) -> None:
+        # When
+        series = PriceSeries(dates, closes)
+        history = PortfolioHistory(dates, closes, closes, closes)
+
+        # Then: The containers are read-only, the caller's arrays are not
+        assert not series.closes.flags.writeable
+        assert not history.values.flags.writeable
+        assert dates.flags.writeable
+        assert closes.flags.writeable
+
+    def test_columns_alias_caller_arrays(
+        self, dates: npt.NDArray[np.datetime64], closes: npt.NDArray[np.float64]
+    ) -> None:
+        # Given
+        series = PriceSeries(dates, closes)
+        history = PortfolioHistory(dates, closes, closes, closes)
+
+        # When: The caller writes to its array after handing it over
+        closes[0] = 99.0
+
+        # Then: The write shows through (views, not copies)
+        assert series.closes[0] == 99.0
+        assert history.values[0] == 99.0
+
+
+class TestPriceSeries:
+    """Test PriceSeries constructor checks"""
+
+    def test_raises_on_length_mismatch(
+        self, dates: npt.NDArray[np.datetime64], closes: npt.NDArray[np.float64]
+    ) -> None:
+        # When / Then
+        with pytest.raises(ValueError, match="Price columns must have the same length"):
+            PriceSeries(dates, closes[:2])
+
+    @pytest.mark.parametrize("bad_close", [0.0, -1.0], ids=["zero", "negative"])
+    def test_raises_on_non_positive_close(
+        self,
+        dates: npt.NDArray[np.datetime64],
+        closes: npt.NDArray[np.float64],
+        bad_close: float,
+    ) -> None:
+        # Given
+        closes[1] = bad_close
+
+        # When / Then
+        with pytest.raises(ValueError, match="Prices must be positive"):
+            PriceSeries(dates, closes)
+
+
+class TestPortfolioHistory:
+    """Test PortfolioHistory constructor checks"""
+
+    @pytest.mark.parametrize("short_column", [0, 1, 2], ids=["values", "shares", "invested"])
+    def test_raises_on_length_mismatch(
+        self,
+        dates: npt.NDArray[np.datetime64],
+        closes: npt.NDArray[np.float64],
+        short_column: int,
+    ) -> None:
+        # Given: One column is a day short
+        columns = [closes, closes, closes]
+        columns[short_column] = closes[:2]
+
+        # When / Then
+        with pytest.raises(ValueError, match="History columns must have the same length"):
+            PortfolioHistory(dates, *columns)
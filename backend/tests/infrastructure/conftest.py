@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the infrastructure tests
+
+The Yahoo Finance adapter is created once per session, so integration tests
+reuse its HTTP session (pooled connections) and in-memory cache.
+
+The integration tests using them call Yahoo Finance live (network required).
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+
+import pytest
+
+from infrastructure.yfinance_adapter import YFinanceAdapter
+
+
+@pytest.fixture(scope="session")
+def adapter() -> Iterator[YFinanceAdapter]:
+    """Adapter instance shared by the session"""
+    adapter = YFinanceAdapter()
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture(scope="session")
+def recent_date_range() -> tuple[datetime, datetime]:
+    """Get recent date range for testing - use fixed historical dates to avoid rate limits"""
+    # Use fixed date range (2024-01-01 to 2024-06-30)
+    start_date = datetime(2024, 1, 1)
+    end_date = datetime(2024, 6, 30)
+    return start_date, end_date
@@ -0,0 +1,117 @@
+"""
+Tests for infrastructure/cache.py
+
+Unit tests for the file-based stock cache, using a temporary directory.
+"""
+
+import os
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from domain.models import StockPrice
+from infrastructure.cache import StockCache
+
+
+class TestStockCache:
+    """Unit tests for StockCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> StockCache:
+        """Cache writing to a temporary directory"""
+        return StockCache(cache_dir=str(tmp_path))
+
+    def test_round_trip(self, cache: StockCache) -> None:
+        # Given
+        prices = [
+            StockPrice(date=datetime(2024, 1, 2), close=100.5),
+            StockPrice(date=datetime(2024, 1, 3), close=101.25),
+        ]
+
+        # When
+        cache.set("AAPL", date(2024, 1, 1), date(2024, 6, 30), prices, "Test")
+        entry = cache.get("AAPL", date(2024, 1, 1), date(2024, 6, 30))
+
+        # Then
+        assert entry is not None
+        assert list(entry.prices()) == prices
+        assert entry.close_array().tolist() == [100.5, 101.25]
+        assert entry.stock_name == "Test"
+
+    def test_write_leaves_no_temporary_files(self, cache: StockCache, tmp_path: Path) -> None:
+        # When
+        cache.set("AAPL", date(2024, 1, 1), date(2024, 6, 30), [], "Test")
+
+        # Then: Only the final entry is left behind, in its shard directory
+        files = [p for p in tmp_path.rglob("*") if p.is_file()]
+        assert [p.suffix for p in files] == [".msgpack"]
+        assert files[0].parent.parent == tmp_path
+
+    def test_miss_for_other_range(self, cache: StockCache) -> None:
+        # Given
+        cache.set("AAPL", date(2024, 1, 1), date(2024, 6, 30), [], "Test")
+
+        # When / Then
+        assert cache.get("AAPL", date(2024, 1, 1), date(2024, 7, 31)) is None
+
+    def test_corrupt_file_is_a_miss(self, cache: StockCache) -> None:
+        # Given
+        cache.set("AAPL", date(2024, 1, 1), date(2024, 6, 30), [], "Test")
+        cache.path_for("AAPL", date(2024, 1, 1), date(2024, 6, 30)).write_bytes(b"not msgpack")
+
+        # When / Then
+        assert cache.get("AAPL", date(2024, 1, 1), date(2024, 6, 30)) is None
+
+    def test_expired_entries_are_removed(self, cache: StockCache) -> None:
+        # Given: An entry written 25 hours ago (TTL is 24 hours)
+        cache.set("AAPL", date(2024, 1, 1), date(2024, 6, 30), [], "Test")
+        written = time.time() - 25 * 3600
+        os.utime(cache.path_for("AAPL", date(2024, 1, 1), date(2024, 6, 30)), (written, written))
+
+        # When
+        removed = cache.clear_expired()
+
+        # Then
+        assert removed == 1
+        assert cache.get("AAPL", date(2024, 1, 1), date(2024, 6, 30)) is None
+
+    def test_sweep_continues_past_a_failing_file(
+        self, cache: StockCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given: Three expired entries, one of which cannot be removed
+        written = time.time() - 25 * 3600
+        for symbol in ("AAPL", "MSFT", "GOOGL"):
+            cache.set(symbol, date(2024, 1, 1), date(2024, 6, 30), [], symbol)
+            path = cache.path_for(symbol, date(2024, 1, 1), date(2024, 6, 30))
+            os.utime(path, (written, written))
+        locked = next(cache._iter_cache_files()).path  # First file the sweep visits
+        unlink = os.unlink
+
+        def failing_unlink(path: str) -> None:
+            if path == locked:
+                raise PermissionError(path)
+            unlink(path)
+
+        monkeypatch.setattr(os, "unlink", failing_unlink)
+
+        # When
+        removed = cache.clear_expired()
+
+        # Then: The other expired entries are still removed
+        assert removed == 2
+        assert [entry.path for entry in cache._iter_cache_files()] == [locked]
+
+    def test_clear_all_removes_only_cache_files(self, cache: StockCache, tmp_path: Path) -> None:
+        # Given
+        cache.set("AAPL", date(2024, 1, 1), date(2024, 6, 30), [], "A")
+        cache.set("MSFT", date(2024, 1, 1), date(2024, 6, 30), [], "M")
+        (tmp_path / ".gitignore").write_text("*.msgpack\n")
+
+        # When
+        removed = cache.clear_all()
+
+        # Then
+        assert removed == 2
+        assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == [".gitignore"]
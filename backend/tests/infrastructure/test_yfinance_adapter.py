@@ -1,34 +1,45 @@
 """
 Tests for infrastructure/yfinance_adapter.py
 
-These are integration tests that make real API calls to Yahoo Finance.
-Mark with @pytest.mark.integration to allow selective execution.
+These are integration tests that call Yahoo Finance live over the network
+(nothing is recorded or replayed), so they need network access.
+Marked integration and slow, so they only run on request (-m integration).
+Cache behavior is unit tested with the loading step mocked out.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import Mock
 
+import msgspec
+import numpy as np
+import orjson
+import pandas as pd
 import pytest
 
-from domain.models import StockPrice
-from infrastructure.yfinance_adapter import StockDataError, YFinanceAdapter
+from domain.models import PriceSeries, StockPrice
+from infrastructure.cache import CacheEntry, StockCache
+from infrastructure.yfinance_adapter import NoDataError, StockDataError, YFinanceAdapter
 
+# Symbols fetched one per test by TestYFinanceAdapter.test_fetch_symbol
+_MULTI_SYMBOLS = ("AAPL", "MSFT", "GOOGL")
 
-@pytest.mark.integration
-class TestYFinanceAdapter:
-    """Integration tests for Yahoo Finance adapter"""
 
-    @pytest.fixture
-    def adapter(self) -> YFinanceAdapter:
-        """Create adapter instance"""
-        return YFinanceAdapter()
+def _assert_valid_prices(prices: PriceSeries) -> None:
+    """Check a fetched series column-wise: non-empty, positive closes, StockPrice rows"""
+    assert isinstance(prices, PriceSeries)
+    assert len(prices) > 0
+    assert (prices.closes > 0).all()
+    assert type(prices[0]) is StockPrice
 
-    @pytest.fixture
-    def recent_date_range(self) -> tuple[datetime, datetime]:
-        """Get recent date range for testing - use fixed historical dates to avoid rate limits"""
-        # Use fixed date range (2024-01-01 to 2024-06-30)
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 6, 30)
-        return start_date, end_date
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.xdist_group("yahoo")
+class TestYFinanceAdapter:
+    """Integration tests for Yahoo Finance adapter (fixtures in conftest.py)"""
 
     def test_fetches_valid_stock_data(
         self, adapter: YFinanceAdapter, recent_date_range: tuple[datetime, datetime]
@@ -42,8 +53,7 @@ class TestYFinanceAdapter:
 
         # Then
         assert len(prices) > 100  # Should have many trading days
-        assert all(isinstance(p, StockPrice) for p in prices)
-        assert all(p.close > 0 for p in prices)
+        _assert_valid_prices(prices)
         assert stock_name  # Should have a name
         assert "Apple" in stock_name or stock_name == "AAPL"
 
@@ -61,18 +71,19 @@ class TestYFinanceAdapter:
         dates = [p.date for p in prices]
         assert dates == sorted(dates)
 
-    def test_handles_taiwan_stock(self, adapter: YFinanceAdapter) -> None:
+    def test_handles_taiwan_stock(
+        self, adapter: YFinanceAdapter, recent_date_range: tuple[datetime, datetime]
+    ) -> None:
         # Given: Taiwan stock (requires .TW suffix)
         symbol = "2330.TW"  # TSMC
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=180)
+        start_date, end_date = recent_date_range
 
         # When
         prices, stock_name = adapter.get_stock_data(symbol, start_date, end_date)
 
         # Then
         assert len(prices) > 50
-        assert all(p.close > 0 for p in prices)
+        _assert_valid_prices(prices)
         assert stock_name  # Should have name
 
     def test_raises_on_invalid_symbol(
@@ -139,28 +150,381 @@ class TestYFinanceAdapter:
         prices, stock_name = adapter.get_stock_data(symbol, start_date, end_date)
 
         # Then: All types should be correct
-        assert isinstance(prices, list)
+        _assert_valid_prices(prices)
         assert isinstance(stock_name, str)
-        for price in prices:
-            assert isinstance(price, StockPrice)
-            assert isinstance(price.date, datetime)
-            assert isinstance(price.close, float)
-
-    def test_handles_multiple_requests(
-        self, adapter: YFinanceAdapter, recent_date_range: tuple[datetime, datetime]
+        assert prices.dates.dtype == np.dtype("datetime64[us]")
+        assert prices.closes.dtype == np.float64
+        assert isinstance(prices[0].date, datetime)
+        assert isinstance(prices[0].close, float)
+
+    @pytest.mark.parametrize("symbol", _MULTI_SYMBOLS)
+    def test_fetch_symbol(
+        self,
+        symbol: str,
+        adapter: YFinanceAdapter,
+        recent_date_range: tuple[datetime, datetime],
     ) -> None:
         # Given
-        symbols = ["AAPL", "MSFT", "GOOGL"]
         start_date, end_date = recent_date_range
 
-        # When: Make multiple requests
-        results = []
-        for symbol in symbols:
-            prices, name = adapter.get_stock_data(symbol, start_date, end_date)
-            results.append((symbol, prices, name))
-
-        # Then: All should succeed
-        assert len(results) == 3
-        for _symbol, prices, name in results:
-            assert len(prices) > 100
-            assert name
+        # When
+        prices, name = adapter.get_stock_data(symbol, start_date, end_date)
+
+        # Then
+        assert len(prices) > 100
+        _assert_valid_prices(prices)
+        assert name
+
+
+@pytest.fixture(scope="module")
+def chart_content() -> bytes:
+    """Chart API response: H1 2024 business days at the 09:30 New York open"""
+    days = pd.bdate_range("2024-01-01", "2024-06-28").to_numpy(dtype="datetime64[s]")
+    opens = days.astype(np.int64) + (14 * 60 + 30) * 60  # UTC seconds
+    closes = np.linspace(180.0, 200.0, len(days))
+    payload = {
+        "chart": {
+            "result": [
+                {
+                    "meta": {"longName": "Apple Inc.", "gmtoffset": -18000},
+                    "timestamp": opens.tolist(),
+                    "indicators": {"quote": [{"close": closes.tolist()}]},
+                }
+            ]
+        }
+    }
+    return orjson.dumps(payload)
+
+
+class TestYFinanceAdapterContract:
+    """Data-shape checks from TestYFinanceAdapter against a synthetic chart response"""
+
+    @pytest.fixture
+    def offline_adapter(self, chart_content: bytes) -> YFinanceAdapter:
+        """Adapter whose HTTP session always returns the synthetic response"""
+        session = Mock()
+        session.get.return_value.content = chart_content
+        return YFinanceAdapter(cache_enabled=False, session=session)
+
+    @pytest.fixture
+    def prices(self, offline_adapter: YFinanceAdapter) -> PriceSeries:
+        """Prices for the synthetic response"""
+        prices, _ = offline_adapter.get_stock_data("AAPL", date(2024, 1, 1), date(2024, 6, 30))
+        return prices
+
+    def test_prices_are_chronological(self, prices: PriceSeries) -> None:
+        # Then
+        assert (np.diff(prices.dates) > np.timedelta64(0)).all()
+
+    def test_handles_weekend_dates(self, prices: PriceSeries) -> None:
+        # Then: Weekend calendar days are simply absent
+        assert len(prices) > 100
+        assert (pd.DatetimeIndex(prices.dates).dayofweek < 5).all()
+
+    def test_returns_consistent_data_types(self, offline_adapter: YFinanceAdapter) -> None:
+        # When
+        prices, stock_name = offline_adapter.get_stock_data(
+            "AAPL", date(2024, 1, 1), date(2024, 6, 30)
+        )
+
+        # Then
+        _assert_valid_prices(prices)
+        assert stock_name == "Apple Inc."
+        assert prices.dates.dtype == np.dtype("datetime64[us]")
+        assert prices.closes.dtype == np.float64
+        assert prices[0] == StockPrice(date=datetime(2024, 1, 1, 9, 30), close=180.0)
+
+
+class TestInMemoryCache:
+    """Unit tests for the adapter's in-memory cache (no network)"""
+
+    @pytest.fixture
+    def load(self) -> Mock:
+        """Mocked file cache / network loading step"""
+        return Mock(return_value=([StockPrice(date=datetime(2024, 1, 2), close=100.0)], "Test"))
+
+    def test_repeated_requests_are_served_from_memory(
+        self, load: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given
+        adapter = YFinanceAdapter()
+        monkeypatch.setattr(adapter, "_load_stock_data", load)
+        start_date, end_date = date(2024, 1, 1), date(2024, 6, 30)
+
+        # When
+        first = adapter.get_stock_data("AAPL", start_date, end_date)
+        second = adapter.get_stock_data("AAPL", start_date, end_date)
+
+        # Then: Loaded once, same data both times
+        assert first == second
+        load.assert_called_once_with("AAPL", start_date, end_date)
+
+    def test_disabled_cache_always_loads(self, load: Mock, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Given
+        adapter = YFinanceAdapter(cache_enabled=False)
+        monkeypatch.setattr(adapter, "_load_stock_data", load)
+        start_date, end_date = date(2024, 1, 1), date(2024, 6, 30)
+
+        # When
+        adapter.get_stock_data("AAPL", start_date, end_date)
+        adapter.get_stock_data("AAPL", start_date, end_date)
+
+        # Then
+        assert load.call_count == 2
+
+    def test_invalidate_forces_reload(self, load: Mock, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Given: AAPL and MSFT are cached in memory
+        adapter = YFinanceAdapter(cache_enabled=True)
+        monkeypatch.setattr(adapter, "_load_stock_data", load)
+        start_date, end_date = date(2024, 1, 1), date(2024, 6, 30)
+        adapter.get_stock_data("AAPL", start_date, end_date)
+        adapter.get_stock_data("MSFT", start_date, end_date)
+
+        # When: Only AAPL is invalidated
+        adapter.invalidate("AAPL")
+        adapter.get_stock_data("AAPL", start_date, end_date)
+        adapter.get_stock_data("MSFT", start_date, end_date)
+
+        # Then: AAPL loaded again, MSFT still served from memory
+        assert [c.args[0] for c in load.call_args_list] == ["AAPL", "MSFT", "AAPL"]
+
+    def test_missing_data_is_remembered(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Given: A symbol without data
+        adapter = YFinanceAdapter(cache_enabled=True)
+        load = Mock(side_effect=NoDataError("No data available for BAD"))
+        monkeypatch.setattr(adapter, "_load_stock_data", load)
+        start_date, end_date = date(2024, 1, 1), date(2024, 6, 30)
+
+        # When/Then: Both requests fail, only the first one loads
+        for _ in range(2):
+            with pytest.raises(StockDataError, match="No data available for BAD"):
+                adapter.get_stock_data("BAD", start_date, end_date)
+        load.assert_called_once()
+
+    def test_transport_errors_are_not_remembered(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Given: A fetch that fails for a transient reason, then succeeds
+        adapter = YFinanceAdapter(cache_enabled=True)
+        load = Mock(
+            side_effect=[
+                StockDataError("Failed to fetch data for AAPL: Read timed out"),
+                ([StockPrice(date=datetime(2024, 1, 2), close=100.0)], "Apple Inc."),
+            ]
+        )
+        monkeypatch.setattr(adapter, "_load_stock_data", load)
+        start_date, end_date = date(2024, 1, 1), date(2024, 6, 30)
+
+        # When
+        with pytest.raises(StockDataError, match="Read timed out"):
+            adapter.get_stock_data("AAPL", start_date, end_date)
+        _, stock_name = adapter.get_stock_data("AAPL", start_date, end_date)
+
+        # Then: The second request loaded again
+        assert stock_name == "Apple Inc."
+        assert load.call_count == 2
+
+    def test_datetimes_are_truncated_to_dates(
+        self, load: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given
+        adapter = YFinanceAdapter(cache_enabled=True)
+        monkeypatch.setattr(adapter, "_load_stock_data", load)
+
+        # When: Same days, once as datetimes and once as dates
+        adapter.get_stock_data("AAPL", datetime(2024, 1, 1, 9, 30), datetime(2024, 6, 30, 23, 59))
+        adapter.get_stock_data("AAPL", date(2024, 1, 1), date(2024, 6, 30))
+
+        # Then: One load, keyed by calendar dates
+        load.assert_called_once_with("AAPL", date(2024, 1, 1), date(2024, 6, 30))
+
+
+class TestFetchWithRequests:
+    """Unit tests for parsing the Yahoo chart response (HTTP session mocked)"""
+
+    @staticmethod
+    def chart_payload(closes: list[float | None]) -> dict[str, object]:
+        """Chart API response for 09:00 Taipei (01:00 UTC) on consecutive January days"""
+        first = int(datetime(2024, 1, 2, 1, 0, tzinfo=timezone.utc).timestamp())
+        return {
+            "chart": {
+                "result": [
+                    {
+                        "meta": {"longName": "Taiwan Semiconductor", "gmtoffset": 28800},
+                        "timestamp": [first + day * 86400 for day in range(len(closes))],
+                        "indicators": {"quote": [{"close": closes}]},
+                    }
+                ]
+            }
+        }
+
+    def test_parses_prices_on_exchange_trading_days(self) -> None:
+        # Given: 12 days, one without a close
+        closes: list[float | None] = [500.0 + day for day in range(12)]
+        closes[3] = None
+        session = Mock()
+        session.get.return_value.content = orjson.dumps(self.chart_payload(closes))
+        adapter = YFinanceAdapter(cache_enabled=False, session=session)
+
+        # When
+        result = adapter._fetch_with_requests("2330.TW", date(2024, 1, 1), date(2024, 1, 31))
+
+        # Then: Missing day skipped, dates in Taipei wall-clock time
+        assert result is not None
+        prices, name = result
+        assert name == "Taiwan Semiconductor"
+        assert len(prices) == 11
+        assert prices[0].date == datetime(2024, 1, 2, 9, 0)
+        assert prices[3].date == datetime(2024, 1, 6, 9, 0)
+        assert [p.close for p in prices] == [c for c in closes if c is not None]
+        url = session.get.call_args.args[0]
+        assert url.startswith("https://query1.finance.yahoo.com/v8/finance/chart/2330.TW?")
+        assert url.endswith("&interval=1d")
+
+    def test_name_is_remembered(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Given: A chart response has been parsed
+        session = Mock()
+        session.get.return_value.content = orjson.dumps(self.chart_payload([500.0] * 12))
+        adapter = YFinanceAdapter(cache_enabled=False, session=session)
+        adapter._fetch_with_requests("2330.TW", date(2024, 1, 1), date(2024, 1, 31))
+        ticker = Mock(side_effect=AssertionError("ticker.info should not be needed"))
+        monkeypatch.setattr("yfinance.Ticker", ticker)
+
+        # When
+        name = adapter.get_stock_name("2330.TW")
+
+        # Then
+        assert name == "Taiwan Semiconductor"
+
+    def test_default_session_retries_transient_failures(self) -> None:
+        # When
+        adapter = YFinanceAdapter(cache_enabled=False)
+
+        # Then
+        pool = adapter.session.get_adapter("https://query1.finance.yahoo.com")
+        assert pool.max_retries.total == 2  # type: ignore[attr-defined]
+
+    def test_too_few_prices_returns_none(self) -> None:
+        # Given
+        session = Mock()
+        session.get.return_value.content = orjson.dumps(self.chart_payload([500.0] * 5))
+        adapter = YFinanceAdapter(cache_enabled=False, session=session)
+
+        # When / Then: Falls back to yfinance
+        assert adapter._fetch_with_requests("2330.TW", date(2024, 1, 1), date(2024, 1, 31)) is None
+
+
+class TestYFinanceFallback:
+    """Unit tests for the yfinance fallback (yf.Ticker mocked)"""
+
+    def test_converts_history_frame(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Given: The chart API fails; yfinance returns 12 days, one without a close
+        closes = [100.0 + day for day in range(12)]
+        closes[5] = float("nan")
+        index = pd.date_range("2024-01-02", periods=12, freq="D", tz="America/New_York")
+        ticker = Mock()
+        ticker.history.return_value = pd.DataFrame({"Close": closes}, index=index)
+        ticker.history_metadata = {"longName": "Apple Inc."}
+        monkeypatch.setattr("yfinance.Ticker", Mock(return_value=ticker))
+        adapter = YFinanceAdapter(cache_enabled=False)
+        monkeypatch.setattr(adapter, "_fetch_with_requests", Mock(return_value=None))
+
+        # When
+        prices, name = adapter.get_stock_data("AAPL", date(2024, 1, 1), date(2024, 1, 31))
+
+        # Then: NaN row skipped, dates as naive exchange wall-clock time
+        assert name == "Apple Inc."
+        assert len(prices) == 11
+        assert prices[0].date == datetime(2024, 1, 2)
+        assert prices[5].date == datetime(2024, 1, 8)
+        assert [p.close for p in prices] == [c for c in closes if c == c]
+
+
+class TestFileCache:
+    """Unit tests for the file cache round trip (network fetch mocked)"""
+
+    def test_cached_prices_keep_wall_clock_dates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given: A fetch returning timezone-aware dates (as yfinance does)
+        taipei = timezone(timedelta(hours=8))
+        fetched = [
+            StockPrice(date=datetime(2024, 1, day, tzinfo=taipei), close=500.0 + day)
+            for day in range(1, 11)
+        ]
+        writer = YFinanceAdapter(cache_enabled=True)
+        writer.cache = StockCache(cache_dir=str(tmp_path))
+        monkeypatch.setattr(writer, "_fetch_with_requests", Mock(return_value=(fetched, "TSMC")))
+        writer.get_stock_data("2330.TW", date(2024, 1, 1), date(2024, 1, 31))
+
+        # When: A fresh adapter reads the same request from the file cache
+        reader = YFinanceAdapter(cache_enabled=True)
+        reader.cache = StockCache(cache_dir=str(tmp_path))
+        prices, name = reader.get_stock_data("2330.TW", date(2024, 1, 1), date(2024, 1, 31))
+
+        # Then: Same trading days and closes, as naive wall-clock dates
+        assert name == "TSMC"
+        assert [p.date for p in prices] == [datetime(2024, 1, day) for day in range(1, 11)]
+        assert [p.close for p in prices] == [p.close for p in fetched]
+
+    def test_invalid_cached_columns_are_refetched(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given: A cache file that decodes but holds a truncated closes column
+        start_date, end_date = date(2024, 1, 1), date(2024, 1, 31)
+        cache = StockCache(cache_dir=str(tmp_path))
+        entry = CacheEntry(stock_name="TSMC", dates=bytes(8 * 10), closes=bytes(8 * 9))
+        path = cache.path_for("2330.TW", start_date, end_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(msgspec.msgpack.encode(entry))
+        fetched = PriceSeries(
+            np.arange(np.datetime64("2024-01-02"), np.datetime64("2024-01-12")),
+            np.full(10, 500.0),
+        )
+        adapter = YFinanceAdapter(cache_enabled=True)
+        adapter.cache = cache
+        fetch = Mock(return_value=(fetched, "TSMC"))
+        monkeypatch.setattr(adapter, "_fetch_with_requests", fetch)
+
+        # When
+        prices, name = adapter.get_stock_data("2330.TW", start_date, end_date)
+
+        # Then: Fetched again instead of raising
+        fetch.assert_called_once()
+        assert list(prices) == list(fetched)
+        assert name == "TSMC"
+
+
+class TestRequestCoalescing:
+    """Unit tests for get_stock_data_async() (no network)"""
+
+    def test_concurrent_identical_requests_share_one_fetch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given: A slow fetch, so both requests overlap
+        def slow_fetch(symbol: str, start_date: date, end_date: date) -> tuple[PriceSeries, str]:
+            time.sleep(0.05)
+            return PriceSeries(
+                np.array(["2024-01-02"], "datetime64[us]"), np.array([100.0])
+            ), "Test"
+
+        adapter = YFinanceAdapter(cache_enabled=False)
+        fetch = Mock(side_effect=slow_fetch)
+        monkeypatch.setattr(adapter, "get_stock_data", fetch)
+        start_date, end_date = date(2024, 1, 1), date(2024, 6, 30)
+
+        async def run_both() -> tuple[tuple[PriceSeries, str], ...]:
+            return tuple(
+                await asyncio.gather(
+                    adapter.get_stock_data_async("AAPL", start_date, end_date),
+                    adapter.get_stock_data_async("AAPL", start_date, end_date),
+                )
+            )
+
+        # When
+        first, second = asyncio.run(run_both())
+
+        # Then: One fetch, both callers get the data, nothing left in flight
+        fetch.assert_called_once_with("AAPL", start_date, end_date)
+        # (the immutable price series is shared, not copied)
+        assert first[0] is second[0]
+        assert list(first[0]) == [StockPrice(date=datetime(2024, 1, 2), close=100.0)]
+        assert not adapter._inflight